@@ -46,6 +46,8 @@ setup(
             "pytest-cov>=4.1.0",
             "pytest-asyncio>=0.21.0",
             "pytest-mock>=3.11.0",
+            "pytest-timeout>=2.1.0",
+            "pytest-xdist>=3.3.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.5.0",
@@ -53,6 +55,11 @@ setup(
             "build>=1.0.0",
             "wheel>=0.42.0",
         ],
+        "accel": [
+            "numba>=0.58.0",
+            "xxhash>=3.0.0",
+            "soundfile>=0.12.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -385,6 +385,16 @@ class ATCController:
         self.removed_counts[queue_type] = 0
         logger.info(f"Cleared {queue_type} queue ({count} aircraft)")
 
+    def reset(self):
+        """
+        Reset all controller state (phases, queues and aircraft context).
+        """
+        self.aircraft_phases.clear()
+        self.queues.clear()
+        self.removed_counts.clear()
+        self.context.clear()
+        logger.info("ATC Controller reset")
+
 
 if __name__ == '__main__':
     # Example usage and testing
@@ -351,7 +351,7 @@ class MissionScriptGenerator:
         Generate Lua mission script for ATC functionality
 
         Returns:
-            Complete Lua script as string
+            Complete Lua script as string (the same constant on every call)
         """
         return '''-- DCS Natural Language ATC Mission Script
 -- Place this in your mission triggers or load via DO SCRIPT FILE
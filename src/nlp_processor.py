@@ -10,6 +10,14 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _compile_patterns(pattern_table: Dict[str, List[str]]) -> Dict[str, tuple]:
+    """Compile a {name: [regex, ...]} table (case-insensitive)."""
+    return {
+        name: tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+        for name, patterns in pattern_table.items()
+    }
+
+
 class IntentClassifier:
     """
     Classifies aviation command intents using rule-based patterns
@@ -68,12 +76,11 @@ class IntentClassifier:
         ],
     }
 
+    # Compiled once at import and shared by all instances
+    COMPILED_PATTERNS = _compile_patterns(INTENT_PATTERNS)
+
     def __init__(self):
-        # Compile patterns for efficiency
-        self.compiled_patterns = {
-            intent: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
-            for intent, patterns in self.INTENT_PATTERNS.items()
-        }
+        self.compiled_patterns = self.COMPILED_PATTERNS
 
     def classify(self, text: str) -> str:
         """
@@ -138,12 +145,11 @@ class EntityExtractor:
         ],
     }
 
+    # Compiled once at import and shared by all instances
+    COMPILED_PATTERNS = _compile_patterns(PATTERNS)
+
     def __init__(self):
-        # Compile patterns
-        self.compiled_patterns = {
-            entity: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
-            for entity, patterns in self.PATTERNS.items()
-        }
+        self.compiled_patterns = self.COMPILED_PATTERNS
 
     def extract_callsign(self, text: str) -> Optional[str]:
         """Extract callsign from text"""
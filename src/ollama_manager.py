@@ -25,7 +25,7 @@ class OllamaManager:
     - Robust error handling with retries
     """
 
-    def __init__(self, port: int = 11434, model: str = "llama3.2:3b", timeout: int = 30):
+    def __init__(self, port: int = 11434, model: str = "llama3.2:3b", timeout: float = 30):
         """
         Initialize OllamaManager
 
@@ -47,6 +47,11 @@ class OllamaManager:
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         self._check_future: Optional[concurrent.futures.Future] = None
 
+        # Startup readiness polling: exponential backoff so a server that
+        # comes up quickly is noticed within milliseconds
+        self._start_poll_initial: float = 0.01
+        self._start_poll_max: float = 0.5
+
         logger.info(f"OllamaManager initialized with model={model}, port={port}")
 
     def _check_server_status(self) -> bool:
@@ -116,11 +121,20 @@ class OllamaManager:
             )
 
             # Wait for server to be ready (max timeout seconds)
-            for i in range(self.timeout):
-                time.sleep(1)
+            # (monotonic clock, so wall clock adjustments cannot cut it short)
+            start_time = time.monotonic()
+            deadline = start_time + self.timeout
+            delay = self._start_poll_initial
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(delay, remaining))
                 if self.is_running(force_refresh=True):
-                    logger.info(f"Ollama server started successfully after {i+1} seconds")
+                    elapsed = time.monotonic() - start_time
+                    logger.info(f"Ollama server started successfully after {elapsed:.2f} seconds")
                     return True
+                delay = min(delay * 2, self._start_poll_max)
 
             logger.error(f"Ollama server failed to start within {self.timeout} seconds")
             return False
@@ -8,7 +8,15 @@ Supports:
 - Audio output management
 """
 
+import json
 import logging
+import os
+import queue
+import tempfile
+import threading
+import wave
+import weakref
+from collections import OrderedDict
 from typing import Dict, Optional, Any
 import numpy as np
 import subprocess
@@ -25,12 +33,123 @@ except ImportError:
     logger.warning("sounddevice not available, audio playback disabled")
     sd = None
 
+try:
+    import soundfile as sf
+except ImportError:
+    logger.debug("soundfile not available, saving WAV files with scipy")
+    sf = None
+
 try:
     from scipy import signal
 except ImportError:
     logger.warning("scipy not available, radio effects may be limited")
     signal = None
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    logger.debug("numba not available, using NumPy radio effect kernels")
+    NUMBA_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    logger.debug("xxhash not available, using hashlib cache keys")
+    XXHASH_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _compress_kernel(x, threshold, ratio):
+        """Compression curve applied in a single pass (JIT-compiled)."""
+        out = np.empty_like(x)
+        for i in range(x.shape[0]):
+            v = x[i]
+            if v > threshold:
+                out[i] = threshold + (v - threshold) / ratio
+            elif v < -threshold:
+                out[i] = -threshold + (v + threshold) / ratio
+            else:
+                out[i] = v
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def _noise_kernel(x, noise, noise_level):
+        """Scaled noise added in a single pass (JIT-compiled)."""
+        out = np.empty_like(x)
+        for i in range(x.shape[0]):
+            out[i] = x[i] + noise_level * noise[i]
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def _compress_noise_kernel(x, threshold, ratio, noise, noise_level, out):
+        """Compression then scaled noise, fused into one pass (JIT-compiled)."""
+        for i in range(x.shape[0]):
+            v = x[i]
+            if v > threshold:
+                v = threshold + (v - threshold) / ratio
+            elif v < -threshold:
+                v = -threshold + (v + threshold) / ratio
+            out[i] = v + noise_level * noise[i]
+        return out
+else:
+    def _compress_kernel(x, threshold, ratio):
+        """Compression curve via NumPy element-wise operations."""
+        # Clipping to the threshold and adding back the scaled excess gives
+        # the sign/abs curve with two buffers and no masks
+        out = np.clip(x, -threshold, threshold)
+        excess = np.subtract(x, out)
+        excess *= 1.0 / ratio
+        out += excess
+        return out
+
+    def _noise_kernel(x, noise, noise_level):
+        """Scaled noise added via NumPy with a single output buffer."""
+        out = np.multiply(noise, noise_level, dtype=np.float32)
+        return np.add(out, x, out=out)
+
+    def _compress_noise_kernel(x, threshold, ratio, noise, noise_level, out):
+        """Compression then scaled noise via NumPy with one scratch buffer."""
+        # Compressed = x - excess * (1 - 1/ratio), excess being the part
+        # beyond the threshold; out may be x itself
+        scratch = np.clip(x, -threshold, threshold)
+        np.subtract(x, scratch, out=scratch)
+        scratch *= 1.0 - 1.0 / ratio
+        np.subtract(x, scratch, out=out)
+        np.multiply(noise, noise_level, out=scratch)
+        out += scratch
+        return out
+
+
+def _pump_lines(stream, lines: queue.Queue):
+    """Forward lines from a pipe to a queue until EOF (queued as b"")."""
+    try:
+        for line in iter(stream.readline, b""):
+            lines.put(line)
+    except (OSError, ValueError):
+        pass
+    lines.put(b"")
+
+
+def _terminate_piper(piper: Optional[subprocess.Popen],
+                     piper_dir: Optional[tempfile.TemporaryDirectory],
+                     kill: bool = False):
+    """Stop a persistent Piper process and remove its work directory."""
+    if piper is not None:
+        try:
+            if kill:
+                piper.kill()
+            if piper.stdin is not None:
+                piper.stdin.close()
+            piper.wait(timeout=2)
+        except Exception:
+            piper.kill()
+
+    if piper_dir is not None:
+        piper_dir.cleanup()
+
 
 class TTSEngine:
     """
@@ -48,6 +167,20 @@ class TTSEngine:
     BANDPASS_LOW_FREQ = 300
     BANDPASS_HIGH_FREQ = 3400
     BANDPASS_ORDER = 4
+    BANDPASS_FIR_TAPS = 129
+    RADIO_LOWPASS_ORDER = 2
+    COMPRESSION_THRESHOLD = 0.2
+    COMPRESSION_RATIO = 4.0
+    STATIC_NOISE_LEVEL = 0.02
+    NOISE_POOL_SECONDS = 10
+    PIPER_TIMEOUT = 10
+
+    # Filter designs and noise pools shared by all engines in the process,
+    # keyed by design parameters / sample rate. Never modify these arrays
+    # (noise pools are flagged read-only; scipy's sosfiltfilt rejects
+    # read-only coefficients, so filter designs are not).
+    _FILTER_CACHE: Dict[tuple, np.ndarray] = {}
+    _NOISE_POOLS: Dict[int, np.ndarray] = {}
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
@@ -61,7 +194,22 @@ class TTSEngine:
                 - radio_effects: Enable radio effects (default True)
                 - cache_enabled: Enable response caching (default True)
                 - cache_max_size: Maximum cache size (default 50)
+                - cache_max_bytes: Maximum cached audio in bytes (default 64 MiB)
+                - cache_key_hash: "fast" (xxhash, else blake2b) or
+                  "sha256" for collision-resistant keys (default "fast")
+                - cache_dir: Directory for the persistent on-disk cache
+                  (default None, memory cache only)
+                - disk_cache_max_bytes: Disk cache size limit in bytes
+                  (default 256 MiB)
                 - quality: "fast", "medium", or "high" (default "medium")
+                - bandpass_filter: "iir" Butterworth (default) or "fir"
+                  linear-phase windowed-sinc applied by FFT convolution
+                - persistent_piper: Keep one Piper process running with the
+                  voice model loaded instead of spawning it per utterance
+                  (default False)
+                - seed: Seed for this engine's radio static (default None).
+                  Seeded engines generate their own noise pool so the
+                  static is reproducible.
         """
         self.config = config or {}
 
@@ -74,26 +222,58 @@ class TTSEngine:
         self.radio_effects_enabled = self.config.get("radio_effects", True)
         self.cache_enabled = self.config.get("cache_enabled", True)
         self.cache_max_size = self.config.get("cache_max_size", 50)
+        self.cache_max_bytes = self.config.get("cache_max_bytes", 64 * 1024 * 1024)
+        self.cache_key_hash = self.config.get("cache_key_hash", "fast")
         self.quality = self.config.get("quality", "medium")
-
-        # Cache storage
-        self.response_cache = {}
+        self.bandpass_filter = self.config.get("bandpass_filter", "iir")
+        self.persistent_piper = self.config.get("persistent_piper", False)
+
+        # Long-running Piper process, started on first use
+        self._piper: Optional[subprocess.Popen] = None
+        self._piper_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._piper_output_file = ""
+        self._piper_replies: Optional[queue.Queue] = None
+        self._piper_finalizer: Optional[weakref.finalize] = None
+        self._piper_lock = threading.Lock()
+
+        # Cache storage, least recently used first
+        self.response_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._cache_bytes = 0
+
+        # Persistent disk tier behind the memory cache (opt-in)
+        self.disk_cache_max_bytes = self.config.get("disk_cache_max_bytes", 256 * 1024 * 1024)
+        self._disk_cache_dir: Optional[Path] = None
+        # File sizes, least recently used first; only scanned from disk here
+        self._disk_cache_entries: OrderedDict[Path, int] = OrderedDict()
+        self._disk_cache_bytes = 0
+        cache_dir = self.config.get("cache_dir")
+        if cache_dir:
+            try:
+                self._disk_cache_dir = Path(cache_dir).expanduser()
+                self._disk_cache_dir.mkdir(parents=True, exist_ok=True)
+                self._scan_disk_cache(self._disk_cache_dir)
+            except Exception as e:
+                logger.error(f"Failed to create TTS disk cache: {e}")
+                self._disk_cache_dir = None
+
+        # Static noise is sliced from a pre-generated pool at random offsets.
+        # Each engine has its own PCG64 generator rather than sharing the
+        # legacy global np.random state.
+        seed = self.config.get("seed")
+        self._rng = np.random.default_rng(seed)
+        if seed is None:
+            self._noise_pool = self._get_noise_pool(self.sample_rate)
+        else:
+            self._noise_pool = self._rng.standard_normal(
+                int(self.sample_rate * self.NOISE_POOL_SECONDS), dtype=np.float32
+            )
 
         # Pre-calculate bandpass filter coefficients
         self.bandpass_sos = None
         if signal is not None:
             try:
-                nyquist = self.sample_rate / 2
-
-                # Ensure frequencies are within Nyquist limit
-                high_freq = min(self.BANDPASS_HIGH_FREQ, nyquist * 0.95)
-
-                self.bandpass_sos = signal.butter(
-                    self.BANDPASS_ORDER,
-                    [self.BANDPASS_LOW_FREQ / nyquist, high_freq / nyquist],
-                    btype='bandpass',
-                    output='sos'
-                )
+                self.bandpass_sos = self._get_bandpass_sos(self.sample_rate)
+                self._get_radio_sos(self.sample_rate)
             except Exception as e:
                 logger.error(f"Failed to pre-calculate bandpass filter: {e}")
 
@@ -109,12 +289,12 @@ class TTSEngine:
         Returns:
             Audio data as numpy array (float32, mono)
         """
-        # Validate input
-        if text is None or not isinstance(text, str):
-            logger.warning(f"Invalid text input: {text}")
-            text = str(text) if text is not None else ""
+        # Nothing to say: skip Piper entirely
+        if not isinstance(text, str):
+            logger.warning(f"Invalid text input: {text!r}")
+            return np.array([], dtype=np.float32)
 
-        if len(text) == 0:
+        if not text.strip():
             return np.array([], dtype=np.float32)
 
         # Check cache first
@@ -122,8 +302,15 @@ class TTSEngine:
             cache_key = self._get_cache_key(text)
             if cache_key in self.response_cache:
                 logger.debug(f"Using cached response for: {text[:50]}")
+                self.response_cache.move_to_end(cache_key)
                 return self.response_cache[cache_key]
 
+            cached = self._load_from_disk(text)
+            if cached is not None:
+                logger.debug(f"Using disk cached response for: {text[:50]}")
+                self._add_to_cache(text, cached)
+                return cached
+
         try:
             # Synthesize with Piper
             audio_data = self._synthesize_with_piper(text)
@@ -132,12 +319,13 @@ class TTSEngine:
             if self.radio_effects_enabled and len(audio_data) > 0:
                 audio_data = self.apply_radio_effects(audio_data)
 
-            # Normalize output
-            audio_data = self._normalize_audio(audio_data)
+            # Normalize output (the buffer is ours, so scale it in place)
+            audio_data = self._normalize_audio(audio_data, out=audio_data)
 
             # Cache the result
             if self.cache_enabled and len(audio_data) > 0:
                 self._add_to_cache(text, audio_data)
+                self._save_to_disk(text, audio_data)
 
             return audio_data
 
@@ -153,34 +341,29 @@ class TTSEngine:
             text: Text to synthesize
 
         Returns:
-            Raw audio data from Piper
+            Piper's raw PCM output as float32 audio
         """
-        try:
-            # In production, this would call Piper TTS binary
-            # For now, we'll simulate it for testing
-            # Command: echo "text" | piper --model voice.onnx --output_raw
+        if self.persistent_piper:
+            audio_data = self._synthesize_with_piper_server(text)
+            if audio_data is not None:
+                return audio_data
 
-            # Mock implementation for testing (returns random audio)
-            # In production, replace with actual Piper subprocess call
+        try:
             logger.debug(f"Synthesizing with Piper: {text[:50]}")
 
-            # Simulate Piper execution
+            # Piper reads text on stdin and streams raw 16-bit PCM to stdout
             result = subprocess.run(
-                ["echo", text],  # Placeholder - would be piper command
+                ["piper", "--model", self.voice_model, "--output-raw"],
+                input=text.encode('utf-8'),
                 capture_output=True,
-                timeout=10
+                timeout=self.PIPER_TIMEOUT
             )
 
             if result.returncode != 0:
                 logger.error("Piper execution failed")
                 return np.array([], dtype=np.float32)
 
-            # For testing: generate simple audio based on text length
-            # In production, this would parse Piper's raw audio output
-            num_samples = min(len(text) * 1000, self.sample_rate * 5)  # Max 5 seconds
-            audio_data = np.random.randn(num_samples).astype(np.float32) * 0.1
-
-            return audio_data
+            return self._pcm16_to_float(result.stdout)
 
         except FileNotFoundError:
             logger.error("Piper TTS not found in PATH")
@@ -190,6 +373,123 @@ class TTSEngine:
             logger.error(f"Piper synthesis failed: {e}")
             return np.array([], dtype=np.float32)
 
+    def _synthesize_with_piper_server(self, text: str) -> Optional[np.ndarray]:
+        """
+        Synthesize text with the persistent Piper process
+
+        Piper runs in --json-input mode: each request line names an output
+        WAV file, and Piper prints that path once the file is written. The
+        voice model therefore loads once rather than per utterance.
+
+        Args:
+            text: Text to synthesize
+
+        Returns:
+            Audio data as float32, or None if the process is unavailable
+            (the caller then falls back to a one-shot Piper run)
+        """
+        with self._piper_lock:
+            try:
+                piper = self._get_piper_server()
+                stdin, replies = piper.stdin, self._piper_replies
+                if stdin is None or replies is None:
+                    raise RuntimeError("Piper process has no pipes")
+                output_file = self._piper_output_file
+
+                request = json.dumps({"text": text, "output_file": output_file})
+                stdin.write(request.encode('utf-8') + b"\n")
+                stdin.flush()
+
+                # Same deadline as the one-shot path; a stalled Piper must
+                # not block this and every other caller on the lock
+                try:
+                    reply = replies.get(timeout=self.PIPER_TIMEOUT)
+                except queue.Empty:
+                    raise RuntimeError(f"Piper did not answer within {self.PIPER_TIMEOUT} s")
+                if not reply:
+                    raise RuntimeError("Piper process exited")
+
+                with wave.open(output_file, 'rb') as wav:
+                    pcm = wav.readframes(wav.getnframes())
+                return self._pcm16_to_float(pcm)
+
+            except Exception as e:
+                logger.warning(f"Persistent Piper failed, using one-shot synthesis: {e}")
+                self._stop_piper_server(kill=True)
+                return None
+
+    def _get_piper_server(self) -> subprocess.Popen:
+        """
+        Get the persistent Piper process, starting it if needed
+
+        Returns:
+            Running Piper process
+        """
+        if self._piper is None or self._piper.poll() is not None:
+            self._stop_piper_server()
+            self._piper_dir = tempfile.TemporaryDirectory(prefix="dcs_tts_")
+            self._piper_output_file = os.path.join(self._piper_dir.name, "utterance.wav")
+            self._piper = subprocess.Popen(
+                ["piper", "--model", self.voice_model, "--json-input"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0
+            )
+            # readline() has no timeout, so a reader thread forwards each
+            # reply line and synthesis waits on the queue with a deadline
+            self._piper_replies = queue.Queue()
+            threading.Thread(
+                target=_pump_lines,
+                args=(self._piper.stdout, self._piper_replies),
+                name="piper-reader",
+                daemon=True
+            ).start()
+            # Reap the process and work directory at interpreter exit or
+            # when the engine is collected without shutdown() being called
+            self._piper_finalizer = weakref.finalize(self, _terminate_piper, self._piper, self._piper_dir)
+            logger.info(f"Started persistent Piper process (pid={self._piper.pid})")
+        return self._piper
+
+    def _stop_piper_server(self, kill: bool = False):
+        """
+        Stop the persistent Piper process and remove its work directory
+
+        Args:
+            kill: Kill the process at once instead of closing its input
+                and waiting for it to exit
+        """
+        piper, self._piper = self._piper, None
+        piper_dir, self._piper_dir = self._piper_dir, None
+        self._piper_replies = None
+        if self._piper_finalizer is not None:
+            self._piper_finalizer.detach()
+            self._piper_finalizer = None
+        _terminate_piper(piper, piper_dir, kill)
+
+    def shutdown(self):
+        """Clean shutdown of the TTS engine"""
+        logger.info("Shutting down TTS engine")
+        with self._piper_lock:
+            self._stop_piper_server()
+
+    @staticmethod
+    def _pcm16_to_float(pcm: bytes) -> np.ndarray:
+        """
+        Convert raw 16-bit PCM bytes to float32 audio
+
+        The bytes are viewed in place and scaled straight into the float32
+        result, with no intermediate int16 or float64 copy.
+
+        Args:
+            pcm: Little-endian int16 samples
+
+        Returns:
+            Audio data in [-1, 1]
+        """
+        samples = np.frombuffer(pcm, dtype='<i2', count=len(pcm) // 2)
+        return np.multiply(samples, 1.0 / 32768.0, dtype=np.float32)
+
     def apply_radio_effects(self, audio_data: np.ndarray) -> np.ndarray:
         """
         Apply military radio effects to audio
@@ -211,31 +511,35 @@ class TTSEngine:
             return audio_data
 
         try:
-            # Apply effects in sequence
-            processed = audio_data.copy()
-
-            # 1. Bandpass filter (300Hz - 3400Hz)
-            processed = self._apply_bandpass_filter(processed, self.sample_rate)
-
-            # 2. Dynamic range compression
-            processed = self._apply_compression(processed)
-
-            # 3. Add radio static
-            processed = self._add_static_noise(processed, noise_level=0.02)
-
-            return processed
+            # 1. Band limiting: bandpass + extra high-end rolloff as one
+            #    stacked SOS cascade, in a single filter pass
+            processed = self._apply_bandpass_filter(audio_data, self.sample_rate, radio=True)
+            if (np.may_share_memory(processed, audio_data) or processed.dtype != np.float32
+                    or not processed.flags.c_contiguous):
+                # Filter was skipped; never modify the caller's array
+                processed = np.array(processed, dtype=np.float32)
+
+            # 2-3. Dynamic range compression and radio static, fused and
+            #      written in place over the filter output
+            noise = self._noise_window(processed.shape[0])
+            return _compress_noise_kernel(
+                processed, self.COMPRESSION_THRESHOLD, self.COMPRESSION_RATIO, noise, self.STATIC_NOISE_LEVEL,
+                processed
+            )
 
         except Exception as e:
             logger.error(f"Radio effects failed: {e}")
             return audio_data
 
-    def _apply_bandpass_filter(self, audio_data: np.ndarray, sample_rate: int) -> np.ndarray:
+    def _apply_bandpass_filter(self, audio_data: np.ndarray, sample_rate: int,
+                               radio: bool = False) -> np.ndarray:
         """
         Apply bandpass filter (300Hz - 3400Hz) for radio effect
 
         Args:
             audio_data: Input audio
             sample_rate: Sample rate in Hz
+            radio: Also apply the radio high-end rolloff (IIR filter only)
 
         Returns:
             Filtered audio
@@ -245,33 +549,125 @@ class TTSEngine:
             return audio_data
 
         try:
-            # Use pre-calculated coefficients if sample rate matches
-            if self.bandpass_sos is not None and sample_rate == self.sample_rate:
-                sos = self.bandpass_sos
-            else:
-                # Design Butterworth bandpass filter
-                nyquist = sample_rate / 2
-
-                # Ensure frequencies are within Nyquist limit
-                high_freq = min(self.BANDPASS_HIGH_FREQ, nyquist * 0.95)
-
-                sos = signal.butter(
-                    self.BANDPASS_ORDER,
-                    [self.BANDPASS_LOW_FREQ / nyquist, high_freq / nyquist],
-                    btype='bandpass',
-                    output='sos'
-                )
-
-            # Apply filter
-            filtered = signal.sosfilt(sos, audio_data)
+            if self.bandpass_filter == "fir":
+                # Symmetric taps centred by mode='same' are already zero-phase
+                taps = self._get_bandpass_taps(sample_rate)
+                filtered = signal.oaconvolve(audio_data, taps, mode='same')
+                return filtered.astype(np.float32)
+
+            sos = self._get_radio_sos(sample_rate) if radio else self._get_bandpass_sos(sample_rate)
+
+            # Zero-phase (forward-backward) filtering keeps the voice
+            # envelope aligned; shorten the edge padding for tiny inputs
+            padlen = min(3 * (2 * len(sos) + 1), len(audio_data) - 1)
+            filtered = signal.sosfiltfilt(sos, audio_data, padlen=max(padlen, 0))
             return filtered.astype(np.float32)
 
         except Exception as e:
             logger.error(f"Bandpass filter failed: {e}")
             return audio_data
 
-    def _apply_compression(self, audio_data: np.ndarray, threshold: float = 0.2,
-                          ratio: float = 4.0) -> np.ndarray:
+    def _get_bandpass_sos(self, sample_rate: int) -> np.ndarray:
+        """
+        Get Butterworth bandpass coefficients for a sample rate
+
+        Coefficients are designed once per process for each sample rate
+        and shared by all engines.
+
+        Args:
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Second-order sections array (shared, do not modify)
+        """
+        key = ("butter", sample_rate, self.BANDPASS_LOW_FREQ, self.BANDPASS_HIGH_FREQ, self.BANDPASS_ORDER)
+        sos = self._FILTER_CACHE.get(key)
+        if sos is None:
+            nyquist = sample_rate / 2
+
+            # Ensure frequencies are within Nyquist limit
+            high_freq = min(self.BANDPASS_HIGH_FREQ, nyquist * 0.95)
+
+            sos = signal.butter(
+                self.BANDPASS_ORDER,
+                [self.BANDPASS_LOW_FREQ / nyquist, high_freq / nyquist],
+                btype='bandpass',
+                output='sos'
+            )
+            self._FILTER_CACHE[key] = sos
+        return sos
+
+    def _get_radio_sos(self, sample_rate: int) -> np.ndarray:
+        """
+        Get the radio band-limiting cascade for a sample rate
+
+        The Butterworth bandpass and a low-order lowpass at its upper edge
+        are stacked into one SOS array, so a single filter pass applies both.
+
+        Args:
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Second-order sections array (shared, do not modify)
+        """
+        key = ("radio", sample_rate, self.BANDPASS_LOW_FREQ, self.BANDPASS_HIGH_FREQ,
+               self.BANDPASS_ORDER, self.RADIO_LOWPASS_ORDER)
+        sos = self._FILTER_CACHE.get(key)
+        if sos is None:
+            high_freq = min(self.BANDPASS_HIGH_FREQ, sample_rate / 2 * 0.95)
+            lowpass = signal.butter(self.RADIO_LOWPASS_ORDER, high_freq, btype='lowpass', fs=sample_rate, output='sos')
+            sos = np.vstack([self._get_bandpass_sos(sample_rate), lowpass])
+            self._FILTER_CACHE[key] = sos
+        return sos
+
+    def _get_bandpass_taps(self, sample_rate: int) -> np.ndarray:
+        """
+        Get windowed-sinc FIR bandpass taps for a sample rate
+
+        Taps are designed once per process for each sample rate and shared
+        by all engines.
+
+        Args:
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            FIR filter taps (shared, do not modify)
+        """
+        key = ("firwin", sample_rate, self.BANDPASS_LOW_FREQ, self.BANDPASS_HIGH_FREQ, self.BANDPASS_FIR_TAPS)
+        taps = self._FILTER_CACHE.get(key)
+        if taps is None:
+            high_freq = min(self.BANDPASS_HIGH_FREQ, sample_rate / 2 * 0.95)
+            taps = signal.firwin(
+                self.BANDPASS_FIR_TAPS,
+                [self.BANDPASS_LOW_FREQ, high_freq],
+                pass_zero=False,
+                fs=sample_rate
+            ).astype(np.float32)
+            self._FILTER_CACHE[key] = taps
+        return taps
+
+    @classmethod
+    def _get_noise_pool(cls, sample_rate: int) -> np.ndarray:
+        """
+        Get the shared static noise pool for a sample rate
+
+        Args:
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            NOISE_POOL_SECONDS of float32 Gaussian noise (read-only)
+        """
+        pool = cls._NOISE_POOLS.get(sample_rate)
+        if pool is None:
+            pool = np.random.default_rng().standard_normal(
+                int(sample_rate * cls.NOISE_POOL_SECONDS), dtype=np.float32
+            )
+            pool.setflags(write=False)
+            cls._NOISE_POOLS[sample_rate] = pool
+        return pool
+
+    def _apply_compression(self, audio_data: np.ndarray, threshold: float = COMPRESSION_THRESHOLD,
+                           ratio: float = COMPRESSION_RATIO) -> np.ndarray:
         """
         Apply dynamic range compression
 
@@ -284,23 +680,20 @@ class TTSEngine:
             Compressed audio
         """
         try:
-            # Simple compression algorithm
-            compressed = np.where(
-                np.abs(audio_data) > threshold,
-                np.sign(audio_data) * (threshold + (np.abs(audio_data) - threshold) / ratio),
-                audio_data
-            )
-
-            return compressed.astype(np.float32)
+            audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+            return _compress_kernel(audio_data, threshold, ratio)
 
         except Exception as e:
             logger.error(f"Compression failed: {e}")
             return audio_data
 
-    def _add_static_noise(self, audio_data: np.ndarray, noise_level: float = 0.02) -> np.ndarray:
+    def _add_static_noise(self, audio_data: np.ndarray, noise_level: float = STATIC_NOISE_LEVEL) -> np.ndarray:
         """
         Add radio static noise
 
+        The noise is a random window of the pool generated at init, so no
+        random draws are made per utterance.
+
         Args:
             audio_data: Input audio
             noise_level: Noise amplitude (0-1)
@@ -309,24 +702,38 @@ class TTSEngine:
             Audio with static noise
         """
         try:
-            # Generate white noise
-            noise = np.random.normal(0, noise_level, len(audio_data)).astype(np.float32)
-
-            # Add noise to audio
-            noisy = audio_data + noise
-
-            return noisy
+            audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+            noise = self._noise_window(audio_data.shape[0])
+            return _noise_kernel(audio_data, noise, noise_level)
 
         except Exception as e:
             logger.error(f"Adding noise failed: {e}")
             return audio_data
 
-    def _normalize_audio(self, audio_data: np.ndarray) -> np.ndarray:
+    def _noise_window(self, n: int) -> np.ndarray:
+        """
+        Get n samples of unit-variance static noise
+
+        Args:
+            n: Number of samples
+
+        Returns:
+            Random window of the noise pool, or fresh noise if n is longer
+        """
+        pool = self._noise_pool
+        if n > pool.shape[0]:
+            return self._rng.standard_normal(n, dtype=np.float32)
+        start = self._rng.integers(0, pool.shape[0] - n + 1)
+        return pool[start:start + n]
+
+    def _normalize_audio(self, audio_data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Normalize audio to range [-1, 1]
 
         Args:
             audio_data: Input audio
+            out: Optional array to write the result into, may be audio_data
+                itself for in-place normalization
 
         Returns:
             Normalized audio
@@ -334,9 +741,10 @@ class TTSEngine:
         if len(audio_data) == 0:
             return audio_data
 
-        max_val = np.max(np.abs(audio_data))
+        # Peak magnitude without an abs() temporary
+        max_val = max(float(audio_data.max()), -float(audio_data.min()))
         if max_val > 0:
-            return audio_data / max_val
+            return np.multiply(audio_data, 1.0 / max_val, out=out)
         return audio_data
 
     def _get_cache_key(self, text: str) -> str:
@@ -347,30 +755,184 @@ class TTSEngine:
             text: Input text
 
         Returns:
-            MD5 hash of text
+            Hex digest of voice, effects setting and text
         """
         # Include voice model and effects in key
-        key_string = f"{text}_{self.voice_model}_{self.radio_effects_enabled}"
-        return hashlib.md5(key_string.encode()).hexdigest()
+        key_bytes = f"{self.voice_model}|{self.radio_effects_enabled}|{text}".encode('utf-8')
+        if self.cache_key_hash == "sha256":
+            return hashlib.sha256(key_bytes).hexdigest()
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_64_hexdigest(key_bytes)
+        return hashlib.blake2b(key_bytes, digest_size=8).hexdigest()
 
     def _add_to_cache(self, text: str, audio_data: np.ndarray):
         """
-        Add response to cache with size limit
+        Add response to cache, evicting least recently used entries beyond
+        cache_max_size entries or cache_max_bytes of audio
+
+        Memory-mapped disk cache hits do not count toward cache_max_bytes:
+        their pages live in the OS page cache, not the Python heap.
 
         Args:
             text: Input text
             audio_data: Synthesized audio
         """
+        cache = self.response_cache
         cache_key = self._get_cache_key(text)
 
-        # Check cache size limit
-        if len(self.response_cache) >= self.cache_max_size:
-            # Remove oldest entry (FIFO)
-            oldest_key = next(iter(self.response_cache))
-            del self.response_cache[oldest_key]
+        previous = cache.pop(cache_key, None)
+        if previous is not None:
+            self._cache_bytes -= self._heap_nbytes(previous)
+        cache[cache_key] = audio_data
+        self._cache_bytes += self._heap_nbytes(audio_data)
+
+        while cache and (len(cache) > self.cache_max_size or self._cache_bytes > self.cache_max_bytes):
+            _, evicted = cache.popitem(last=False)
+            self._cache_bytes -= self._heap_nbytes(evicted)
+
+        logger.debug(f"Cached response for: {text[:50]} (cache size: {len(cache)})")
+
+    @staticmethod
+    def _heap_nbytes(audio_data: np.ndarray) -> int:
+        """Bytes an array holds outside of a memory-mapped file"""
+        return 0 if isinstance(audio_data, np.memmap) else audio_data.nbytes
+
+    def clear_cache(self):
+        """Clear the in-memory response cache"""
+        self.response_cache.clear()
+        self._cache_bytes = 0
+
+    def _get_disk_cache_path(self, cache_dir: Path, text: str) -> Path:
+        """
+        Get the content-addressed disk cache file for text
+
+        Args:
+            cache_dir: Disk cache directory
+            text: Input text
+
+        Returns:
+            Path of the .npy file inside the cache directory
+        """
+        key_string = f"{self.voice_model}|{self.radio_effects_enabled}|{text}"
+        digest = hashlib.blake2b(key_string.encode(), digest_size=16).hexdigest()
+        return cache_dir / f"{digest}.npy"
+
+    def _load_from_disk(self, text: str) -> Optional[np.ndarray]:
+        """
+        Load a synthesized response from the disk cache
+
+        The file is memory-mapped read-only, so a hit costs a page-in
+        rather than a full read.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Cached audio, or None on a miss or when the disk cache is off
+        """
+        cache_dir = self._disk_cache_dir
+        if cache_dir is None:
+            return None
+
+        path = self._get_disk_cache_path(cache_dir, text)
+        try:
+            audio_data = np.load(path, mmap_mode='r')
+            # Refresh the access time used for LRU eviction
+            os.utime(path)
+            if path in self._disk_cache_entries:
+                self._disk_cache_entries.move_to_end(path)
+            else:
+                # Written by another engine sharing the directory
+                self._track_disk_entry(path, path.stat().st_size)
+            return audio_data
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read TTS disk cache {path.name}: {e}")
+            return None
+
+    def _save_to_disk(self, text: str, audio_data: np.ndarray):
+        """
+        Write a synthesized response to the disk cache
+
+        Args:
+            text: Input text
+            audio_data: Synthesized audio
+        """
+        cache_dir = self._disk_cache_dir
+        if cache_dir is None:
+            return
+
+        path = self._get_disk_cache_path(cache_dir, text)
+        tmp_path = None
+        try:
+            # Unique temp name so concurrent writers of one key cannot
+            # clobber each other's partial file
+            with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False) as f:
+                tmp_path = Path(f.name)
+                np.save(f, np.asarray(audio_data, dtype=np.float32))
+                size = f.tell()
+            # Atomic rename so readers never see a partial file
+            try:
+                os.replace(tmp_path, path)
+            except PermissionError:
+                # Windows will not replace a file that is memory-mapped;
+                # the existing entry holds the same audio, so keep it
+                tmp_path.unlink(missing_ok=True)
+                return
+            self._track_disk_entry(path, size)
+            self._evict_disk_cache()
+        except Exception as e:
+            logger.warning(f"Failed to write TTS disk cache {path.name}: {e}")
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+    def _scan_disk_cache(self, cache_dir: Path):
+        """
+        Index the files already in the disk cache, oldest first
 
-        self.response_cache[cache_key] = audio_data
-        logger.debug(f"Cached response for: {text[:50]} (cache size: {len(self.response_cache)})")
+        This is the only directory scan; saves and evictions keep the
+        index and byte count up to date afterwards.
+
+        Args:
+            cache_dir: Disk cache directory
+        """
+        entries = []
+        for path in cache_dir.glob("*.npy"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, path, stat.st_size))
+
+        self._disk_cache_entries.clear()
+        self._disk_cache_bytes = 0
+        for _, path, size in sorted(entries):
+            self._track_disk_entry(path, size)
+        self._evict_disk_cache()
+
+    def _track_disk_entry(self, path: Path, size: int):
+        """
+        Record a disk cache file as the most recently used
+
+        Args:
+            path: Cache file
+            size: File size in bytes
+        """
+        self._disk_cache_bytes += size - self._disk_cache_entries.pop(path, 0)
+        self._disk_cache_entries[path] = size
+
+    def _evict_disk_cache(self):
+        """Delete least recently used cache files beyond the byte limit"""
+        for path, size in list(self._disk_cache_entries.items()):
+            if self._disk_cache_bytes <= self.disk_cache_max_bytes:
+                break
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                # Windows cannot delete a file that is still memory-mapped;
+                # skip it and keep evicting so the cache stays bounded
+                logger.debug(f"Cannot evict TTS disk cache {path.name}: {e}")
+                continue
+            del self._disk_cache_entries[path]
+            self._disk_cache_bytes -= size
 
     def play_audio(self, audio_data: np.ndarray) -> bool:
         """
@@ -408,12 +970,22 @@ class TTSEngine:
             True if successful, False otherwise
         """
         try:
-            from scipy.io import wavfile
+            if sf is not None:
+                # libsndfile converts float to 16-bit PCM in C, but wraps
+                # rather than clips out-of-range samples
+                if len(audio_data) > 0 and np.max(np.abs(audio_data)) > 1.0:
+                    audio_data = np.clip(audio_data, -1.0, 1.0)
+                sf.write(filepath, audio_data, self.sample_rate, format='WAV', subtype='PCM_16')
+            else:
+                from scipy.io import wavfile
+
+                # Convert to int16 for WAV, scaling and clipping in one buffer
+                scaled = np.multiply(audio_data, 32767, dtype=np.float32)
+                np.clip(scaled, -32768, 32767, out=scaled)
+                audio_int16 = scaled.astype(np.int16)
 
-            # Convert to int16 for WAV
-            audio_int16 = (audio_data * 32767).astype(np.int16)
+                wavfile.write(filepath, self.sample_rate, audio_int16)
 
-            wavfile.write(filepath, self.sample_rate, audio_int16)
             logger.info(f"Saved audio to: {filepath}")
             return True
 
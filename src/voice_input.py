@@ -11,10 +11,14 @@ This module handles:
 Author: DCS Natural Language ATC Project
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import numpy as np
 from typing import Optional, Dict, List, Any
 import threading
+import time
 
 
 logger = logging.getLogger(__name__)
@@ -30,6 +34,7 @@ except ImportError:
     # Create mock for testing
     class MockSD:
         class InputStream:
+            __slots__ = ()
             def __init__(self, *args, **kwargs):
                 pass
             def start(self):
@@ -38,6 +43,8 @@ except ImportError:
                 pass
             def close(self):
                 pass
+        RawInputStream = InputStream
+
         @staticmethod
         def query_devices(*args, **kwargs):
             return []
@@ -59,6 +66,97 @@ except ImportError:
             return False
     keyboard = MockKeyboard()
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    logger.debug("numba not available, using NumPy VAD energy kernel")
+    NUMBA_AVAILABLE = False
+
+
+# Buffered audio is stored as 16-bit PCM (microphone native resolution),
+# halving memory and bandwidth versus float32
+PCM16_SCALE = 32768.0
+
+
+class _EnqueueOnlyHandler(logging.handlers.QueueHandler):
+    """QueueHandler that defers all formatting to the listener thread."""
+
+    def prepare(self, record):
+        return record
+
+
+class _ForwardHandler(logging.Handler):
+    """Re-emit queued records through the module logger's handlers."""
+
+    def emit(self, record):
+        logger.handle(record)
+
+
+# Logger for the audio capture path. Records are only enqueued there; the
+# lock taking, formatting and I/O of real handlers happen on the listener
+# thread so a slow handler cannot stall the audio callback.
+_audio_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_audio_logger = logging.getLogger(__name__ + ".audio")
+_audio_logger.addHandler(_EnqueueOnlyHandler(_audio_log_queue))
+_audio_logger.propagate = False
+_audio_log_listener: Optional[logging.handlers.QueueListener] = None
+_audio_log_lock = threading.Lock()
+
+
+def _start_audio_log_listener():
+    """Start the audio log listener thread once (flushed at exit)."""
+    global _audio_log_listener
+    with _audio_log_lock:
+        if _audio_log_listener is None:
+            _audio_log_listener = logging.handlers.QueueListener(_audio_log_queue, _ForwardHandler())
+            _audio_log_listener.start()
+            atexit.register(_audio_log_listener.stop)
+
+
+def _parse_hotkey(key: str) -> Optional[tuple]:
+    """
+    Resolve a hotkey string to scan codes once.
+
+    keyboard.parse_hotkey('ctrl+shift') returns one step holding a tuple of
+    scan codes per key. Passing that back to keyboard.is_pressed() would
+    flatten the groups into a single "any of" set, so the groups are kept
+    and checked individually by the caller.
+
+    Args:
+        key: Hotkey string (e.g. 'ctrl+shift')
+
+    Returns:
+        Tuple of scan code groups (all must be held, any code per group),
+        or None if the key cannot be parsed here (mock keyboard, unknown
+        key name, multi-step hotkey)
+    """
+    parse = getattr(keyboard, 'parse_hotkey', None)
+    if parse is None:
+        return None
+    try:
+        steps = parse(key)
+    except Exception as e:
+        logger.debug(f"Could not precompile PTT key '{key}': {e}")
+        return None
+    if len(steps) != 1:
+        return None
+    return steps[0]
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _sum_squares(x):
+        """Sum of squared samples in a single fused pass (JIT-compiled)."""
+        s = 0.0
+        for i in range(x.shape[0]):
+            s += x[i] * x[i]
+        return s
+else:
+    def _sum_squares(x):
+        """Sum of squared samples via a BLAS dot product (no squared temporary)."""
+        return float(x @ x)
+
 
 class VoiceInputHandler:
     """
@@ -81,6 +179,12 @@ class VoiceInputHandler:
                 - max_buffer_seconds: Maximum buffer duration (default: 30)
                 - vad_threshold: Voice activity detection threshold (default: 0.01)
                 - continuous_mode: Continuous recording without PTT (default: False)
+                - device_cache_ttl: Seconds to reuse the input device list (default: 2.0)
+                - capture_mode: 'callback' (default), 'blocking' or 'raw'. Blocking
+                  mode reads the stream from a dedicated thread so no Python code
+                  runs on the PortAudio callback thread. Raw mode uses a
+                  RawInputStream whose callback wraps the PortAudio buffer
+                  without building an ndarray per block.
         """
         self.config = config or {}
 
@@ -90,18 +194,48 @@ class VoiceInputHandler:
         self.chunk_size = self.config.get('chunk_size', 1024)
         self.max_buffer_seconds = self.config.get('max_buffer_seconds', 30)
         self.vad_threshold = self.config.get('vad_threshold', 0.01)
+        self._max_samples = int(self.sample_rate * self.max_buffer_seconds)
+        # Squared threshold lets VAD compare energy directly without a sqrt
+        self._vad_threshold_sq = self.vad_threshold ** 2
 
         # PTT configuration
         self.ptt_key = self.config.get('ptt_key', 'ctrl+shift')
         self.continuous_mode = self.config.get('continuous_mode', False)
+        self.capture_mode = self.config.get('capture_mode', 'callback')
+        self._ptt_hotkey = _parse_hotkey(self.ptt_key)
+        # Mode is fixed at init, so pick the polling step once
+        self._ptt_step = self._check_continuous if self.continuous_mode else self._check_ptt
+
+        # Edge-triggered PTT state kept by a keyboard hook; is_ptt_pressed
+        # falls back to polling keyboard.is_pressed when no hook is installed
+        self._ptt_event = threading.Event()
+        self._ptt_edge = threading.Event()
+        self._ptt_codes: frozenset = frozenset()
+        self._ptt_down_codes: set = set()
+        self._keyboard_hook = None
+        if not self.continuous_mode:
+            self._install_ptt_hook()
 
         # State
         self.is_recording = False
-        self._buffer = np.array([], dtype=np.float32)
+        # Preallocated int16 ring buffer holding the most recent
+        # max_buffer_seconds of samples; the callback only copies into it
+        self._ring = np.zeros(max(1, self._max_samples), dtype=np.int16)
+        self._write_idx = 0
+        self._filled = 0
+        # Float -> int16 conversion scratch, grown if a block is larger
+        self._scratch = np.empty(self.chunk_size, dtype=np.float32)
         self._lock = threading.Lock()
         self._stream = None
+        self._reader_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
         self.device_index = None
 
+        # Device enumeration cache (query_devices touches the audio driver)
+        self.device_cache_ttl = self.config.get('device_cache_ttl', 2.0)
+        self._devices_cache: Optional[List[Dict]] = None
+        self._devices_cache_ts = 0.0
+
         logger.info(f"Voice Input Handler initialized (SR={self.sample_rate}, PTT={self.ptt_key})")
 
     def start_recording(self) -> bool:
@@ -115,17 +249,42 @@ class VoiceInputHandler:
             logger.warning("Already recording")
             return True
 
+        blocking = self.capture_mode == 'blocking'
+        _start_audio_log_listener()
+
         try:
-            # Create audio stream
-            self._stream = sd.InputStream(
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                dtype=np.float32,
-                blocksize=self.chunk_size,
-                callback=self._audio_callback,
-                device=self.device_index
-            )
+            # int16 matches the buffer format so blocks are copied without conversion
+            if self.capture_mode == 'raw':
+                self._stream = sd.RawInputStream(
+                    samplerate=self.sample_rate,
+                    channels=self.channels,
+                    dtype='int16',
+                    blocksize=self.chunk_size,
+                    callback=self._raw_callback,
+                    device=self.device_index
+                )
+            else:
+                # No callback in blocking mode, we read() instead
+                self._stream = sd.InputStream(
+                    samplerate=self.sample_rate,
+                    channels=self.channels,
+                    dtype=np.int16,
+                    blocksize=self.chunk_size,
+                    callback=None if blocking else self._audio_callback,
+                    device=self.device_index
+                )
             self._stream.start()
+
+            if blocking:
+                self._stop_event.clear()
+                self._reader_thread = threading.Thread(
+                    target=self._read_loop,
+                    args=(self._stream,),
+                    name="voice-input-reader",
+                    daemon=True
+                )
+                self._reader_thread.start()
+
             self.is_recording = True
             logger.info("Recording started")
             return True
@@ -147,6 +306,11 @@ class VoiceInputHandler:
             return True
 
         try:
+            if self._reader_thread:
+                self._stop_event.set()
+                self._reader_thread.join(timeout=1.0)
+                self._reader_thread = None
+
             if self._stream:
                 self._stream.stop()
                 self._stream.close()
@@ -164,6 +328,9 @@ class VoiceInputHandler:
         """
         Audio input callback (called by sounddevice).
 
+        Runs on the PortAudio thread, so it does the minimum: report status
+        and hand the block to the buffer.
+
         Args:
             indata: Input audio data
             frames: Number of frames
@@ -171,46 +338,181 @@ class VoiceInputHandler:
             status: Status flags
         """
         if status:
-            logger.warning(f"Audio callback status: {status}")
+            _audio_logger.warning("Audio callback status: %s", status)
 
-        try:
-            if indata is None or frames == 0:
-                return
+        if indata is None or frames == 0:
+            return
 
-            # Convert to 1D array if needed
-            audio_data = indata.flatten() if indata.ndim > 1 else indata
+        self._push_audio(indata)
 
-            with self._lock:
-                # Append to buffer
-                self._buffer = np.concatenate([self._buffer, audio_data])
+    def _raw_callback(self, indata, frames, time_info, status):
+        """
+        Raw audio input callback (capture_mode='raw').
 
-                # Limit buffer size
-                max_samples = self.sample_rate * self.max_buffer_seconds
-                if len(self._buffer) > max_samples:
-                    # Keep only most recent data
-                    self._buffer = self._buffer[-max_samples:]
+        indata is the PortAudio buffer itself; np.frombuffer views it so
+        the samples go straight into the ring buffer.
 
-        except Exception as e:
-            logger.error(f"Error in audio callback: {e}")
+        Args:
+            indata: CFFI buffer of interleaved int16 samples
+            frames: Number of frames
+            time_info: Timing information
+            status: Status flags
+        """
+        if status:
+            _audio_logger.warning("Audio callback status: %s", status)
 
-    def get_audio_data(self) -> Optional[np.ndarray]:
+        if indata is None or frames == 0:
+            return
+
+        self._push_audio(np.frombuffer(indata, dtype=np.int16))
+
+    def _read_loop(self, stream):
+        """
+        Blocking capture loop (capture_mode='blocking').
+
+        stream.read() blocks inside PortAudio with the GIL released, so the
+        realtime audio thread never has to run Python code.
+
+        Args:
+            stream: Started sounddevice InputStream without a callback
+        """
+        while not self._stop_event.is_set():
+            try:
+                data, overflowed = stream.read(self.chunk_size)
+            except Exception as e:
+                logger.error(f"Error reading audio stream: {e}")
+                break
+
+            if overflowed:
+                _audio_logger.warning("Audio input overflow")
+
+            self._push_audio(data)
+
+    @property
+    def _buffer_sample_count(self) -> int:
+        """Number of samples currently buffered."""
+        return self._filled
+
+    def _push_audio(self, indata: np.ndarray):
+        """
+        Write captured samples into the ring buffer, overwriting the oldest
+        samples once max_buffer_seconds is reached.
+
+        Args:
+            indata: Audio block, (frames,) or (frames, channels), either int16
+                PCM or float in [-1, 1]
+        """
+        audio_data = indata.reshape(-1)
+        n = audio_data.shape[0]
+
+        with self._lock:
+            ring = self._ring
+            capacity = ring.shape[0]
+            if n > capacity:
+                # Only the newest samples can survive
+                audio_data = audio_data[-capacity:]
+                n = capacity
+
+            if audio_data.dtype != np.int16:
+                # Scale and clip in the scratch buffer; the int16 cast
+                # happens on assignment into the ring
+                if self._scratch.shape[0] < n:
+                    self._scratch = np.empty(n, dtype=np.float32)
+                scaled = self._scratch[:n]
+                np.multiply(audio_data, PCM16_SCALE, out=scaled)
+                np.clip(scaled, -32768, 32767, out=scaled)
+                audio_data = scaled
+
+            start = self._write_idx
+            end = start + n
+            if end <= capacity:
+                ring[start:end] = audio_data
+            else:
+                split = capacity - start
+                ring[start:] = audio_data[:split]
+                ring[:n - split] = audio_data[split:]
+
+            self._write_idx = end % capacity
+            self._filled = min(self._filled + n, capacity)
+
+    def get_audio_data(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """
         Get recorded audio data.
 
+        Args:
+            out: Optional float32 array to write the samples into. Reused if
+                it is large enough, so a caller polling in a loop can avoid a
+                new allocation per call.
+
         Returns:
-            numpy array of audio samples or None
+            numpy array of float32 audio samples in [-1, 1] (a view of out
+            when it was used) or None
         """
         with self._lock:
-            if len(self._buffer) > 0:
-                return self._buffer.copy()
-            return None
+            n = self._filled
+            if n == 0:
+                return None
+
+            if out is None or out.dtype != np.float32 or out.ndim != 1 or out.shape[0] < n:
+                out = np.empty(n, dtype=np.float32)
+            audio = out[:n]
+
+            # Unwrap the ring and convert int16 -> float32 in one pass
+            ring = self._ring
+            start = (self._write_idx - n) % ring.shape[0]
+            first = min(n, ring.shape[0] - start)
+            np.multiply(ring[start:start + first], 1.0 / PCM16_SCALE, out=audio[:first])
+            if first < n:
+                np.multiply(ring[:n - first], 1.0 / PCM16_SCALE, out=audio[first:])
+            return audio
 
     def clear_buffer(self):
         """Clear audio buffer."""
         with self._lock:
-            self._buffer = np.array([], dtype=np.float32)
+            self._write_idx = 0
+            self._filled = 0
             logger.debug("Audio buffer cleared")
 
+    def _install_ptt_hook(self):
+        """Track the PTT chord from keyboard events instead of polling."""
+        hook = getattr(keyboard, 'hook', None)
+        if hook is None or self._ptt_hotkey is None:
+            return
+
+        self._ptt_codes = frozenset(code for group in self._ptt_hotkey for code in group)
+        try:
+            self._keyboard_hook = hook(self._on_key_event)
+        except Exception as e:
+            # e.g. no permission to read the keyboard device on Linux
+            logger.warning(f"Keyboard hook unavailable, polling PTT key: {e}")
+            self._keyboard_hook = None
+
+    def _on_key_event(self, event):
+        """
+        Keyboard hook callback: update the PTT state on press/release edges.
+
+        Args:
+            event: keyboard.KeyboardEvent
+        """
+        code = event.scan_code
+        if code not in self._ptt_codes:
+            return
+
+        if event.event_type == 'down':
+            self._ptt_down_codes.add(code)
+        else:
+            self._ptt_down_codes.discard(code)
+
+        down = self._ptt_down_codes
+        pressed = all(any(c in down for c in group) for group in self._ptt_hotkey)
+        # Key repeat sends more 'down' events; only real edges are signalled
+        if pressed != self._ptt_event.is_set():
+            if pressed:
+                self._ptt_event.set()
+            else:
+                self._ptt_event.clear()
+            self._ptt_edge.set()
+
     def is_ptt_pressed(self) -> bool:
         """
         Check if PTT key is pressed.
@@ -218,25 +520,56 @@ class VoiceInputHandler:
         Returns:
             bool: True if PTT key is pressed
         """
+        if self._keyboard_hook is not None:
+            return self._ptt_event.is_set()
+
         try:
-            return keyboard.is_pressed(self.ptt_key)
+            groups = self._ptt_hotkey
+            if groups is None:
+                return keyboard.is_pressed(self.ptt_key)
+            return all(any(keyboard.is_pressed(code) for code in group) for group in groups)
         except Exception as e:
             logger.error(f"Error checking PTT key: {e}")
             return False
 
+    def wait_for_ptt(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the PTT key is pressed or released, or timeout.
+
+        With the keyboard hook this wakes on the key event itself; without
+        it, it sleeps for the timeout (polling interval).
+
+        Args:
+            timeout: Maximum seconds to wait (None waits for an edge, or
+                0.1 s when polling)
+
+        Returns:
+            bool: Current PTT state
+        """
+        if self._keyboard_hook is not None:
+            self._ptt_edge.wait(timeout)
+            self._ptt_edge.clear()
+        else:
+            time.sleep(0.1 if timeout is None else timeout)
+        return self.is_ptt_pressed()
+
     def check_ptt_and_record(self):
         """
         Check PTT state and start/stop recording accordingly.
 
-        This should be called periodically in a loop.
+        This should be called periodically in a loop. The step for the
+        configured mode (_check_continuous or _check_ptt) is chosen in
+        __init__.
         """
-        if self.continuous_mode:
-            # In continuous mode, always record
-            if not self.is_recording:
-                self.start_recording()
-            return
+        self._ptt_step()
+
+    def _check_continuous(self):
+        """Continuous mode: always record."""
+        if not self.is_recording:
+            self.start_recording()
 
-        # PTT mode
+    def _check_ptt(self):
+        """PTT mode: record while the PTT key is held."""
         ptt_pressed = self.is_ptt_pressed()
 
         if ptt_pressed and not self.is_recording:
@@ -254,7 +587,10 @@ class VoiceInputHandler:
         """
         Detect if audio contains voice activity.
 
-        Simple energy-based VAD using RMS amplitude.
+        Simple energy-based VAD using RMS amplitude. The comparison
+        rms > threshold is evaluated as sum(x**2) > threshold**2 * N so the
+        buffer is scanned once. Contiguous float32 input is used as is;
+        anything else is first copied to a contiguous float32 array.
 
         Args:
             audio: Audio data array
@@ -265,11 +601,10 @@ class VoiceInputHandler:
         if audio is None or len(audio) == 0:
             return False
 
-        # Calculate RMS amplitude
-        rms = np.sqrt(np.mean(audio**2))
+        samples = np.ascontiguousarray(audio, dtype=np.float32).reshape(-1)
 
-        # Compare against threshold
-        return rms > self.vad_threshold
+        # Compare signal energy against threshold energy
+        return _sum_squares(samples) > self._vad_threshold_sq * samples.shape[0]
 
     # Audio device management
 
@@ -277,9 +612,17 @@ class VoiceInputHandler:
         """
         List available audio input devices.
 
+        Results are cached for ``device_cache_ttl`` seconds since device
+        topology changes far less often than this is called.
+
         Returns:
-            List of device dictionaries
+            List of device dictionaries (copies, so callers cannot alter
+            the cache)
         """
+        now = time.monotonic()
+        if self._devices_cache is not None and now - self._devices_cache_ts < self.device_cache_ttl:
+            return [dict(d) for d in self._devices_cache]
+
         try:
             devices = sd.query_devices()
             if not isinstance(devices, list):
@@ -290,12 +633,20 @@ class VoiceInputHandler:
                 d for d in devices
                 if isinstance(d, dict) and d.get('max_input_channels', 0) > 0
             ]
-            return input_devices
+
+            self._devices_cache = input_devices
+            self._devices_cache_ts = now
+            return [dict(d) for d in input_devices]
 
         except Exception as e:
             logger.error(f"Error listing devices: {e}")
             return []
 
+    def invalidate_device_cache(self):
+        """Force the next list_input_devices() call to re-query the driver."""
+        self._devices_cache = None
+        self._devices_cache_ts = 0.0
+
     def get_default_input_device(self) -> Optional[Dict]:
         """
         Get default audio input device.
@@ -319,6 +670,7 @@ class VoiceInputHandler:
             device_index: Index of the device to use
         """
         self.device_index = device_index
+        self.invalidate_device_cache()
         logger.info(f"Input device set to index {device_index}")
 
         # If currently recording, restart with new device
@@ -333,6 +685,13 @@ class VoiceInputHandler:
         if self.is_recording:
             self.stop_recording()
 
+        if self._keyboard_hook is not None:
+            try:
+                keyboard.unhook(self._keyboard_hook)
+            except Exception as e:
+                logger.debug(f"Error removing keyboard hook: {e}")
+            self._keyboard_hook = None
+
         self.clear_buffer()
 
 
@@ -368,19 +727,19 @@ if __name__ == '__main__':
     print("Press Ctrl+C to exit\n")
 
     try:
-        import time
         while True:
             # Check PTT
             handler.check_ptt_and_record()
 
             # If we have audio, check for voice activity
-            if not handler.is_recording and len(handler._buffer) > 0:
+            if not handler.is_recording and handler._buffer_sample_count > 0:
                 audio = handler.get_audio_data()
                 has_voice = handler.detect_voice_activity(audio)
                 print(f"Audio captured: {len(audio)} samples, Voice: {has_voice}")
                 handler.clear_buffer()
 
-            time.sleep(0.1)
+            # Sleeps until the PTT key changes (or 0.1 s) instead of spinning
+            handler.wait_for_ptt(timeout=0.1)
 
     except KeyboardInterrupt:
         print("\n\nShutting down...")
@@ -0,0 +1,96 @@
+"""
+Shared pytest fixtures
+
+pytest.ini runs the suite under pytest-xdist with --dist=loadfile, so each
+test file stays on one worker. Module-scoped fixtures are therefore built
+once per file and session-scoped ones once per worker. Nothing here is
+shared across workers.
+"""
+
+import numpy as np
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+
+@pytest.fixture(scope="session")
+def _pipeline_stack():
+    """Build the mocked audio pipeline components once per session"""
+    from src.voice_input import VoiceInputHandler
+    from src.stt_engine import STTEngine
+    from src.nlp_processor import AviationCommandParser
+    from src.atc_controller import ATCController
+    from src.tts_engine import TTSEngine
+
+    # WhisperModel is only touched by load_model(); transcribe() goes
+    # through the loaded instance, so the patch can end here
+    mock_model = MagicMock()
+    with patch('src.stt_engine.WhisperModel', return_value=mock_model):
+        stt = STTEngine()
+        stt.load_model()
+
+    return SimpleNamespace(
+        voice=VoiceInputHandler(),
+        stt=stt,
+        nlp_parser=AviationCommandParser(),
+        atc=ATCController(),
+        tts=TTSEngine(config={"radio_effects": True}),
+        mock_model=mock_model,
+    )
+
+
+@pytest.fixture
+def pipeline(_pipeline_stack):
+    """Session pipeline with its mutable state reset for each test"""
+    _pipeline_stack.mock_model.reset_mock(return_value=True, side_effect=True)
+    _pipeline_stack.voice.clear_buffer()
+    _pipeline_stack.atc.reset()
+    _pipeline_stack.tts.clear_cache()
+    _pipeline_stack.tts.radio_effects_enabled = True
+    return _pipeline_stack
+
+
+@pytest.fixture(scope="session")
+def audio_1s():
+    """One second of silent 16 kHz mono audio (read-only, shared)"""
+    audio = np.zeros(16000, dtype=np.float32)
+    audio.setflags(write=False)
+    return audio
+
+
+@pytest.fixture(scope="session")
+def audio_stereo():
+    """One second of silent 16 kHz stereo audio (read-only, shared)"""
+    audio = np.zeros((16000, 2), dtype=np.float32)
+    audio.setflags(write=False)
+    return audio
+
+
+@pytest.fixture(scope="module")
+def _whisper_patch():
+    """Patch WhisperModel once per test module with a preconfigured model"""
+    from src import stt_engine
+
+    with patch.object(stt_engine, 'WhisperModel') as whisper:
+        # Segment and info are plain data holders; only the model's calls are asserted
+        yield SimpleNamespace(whisper=whisper, model=MagicMock(), segment=SimpleNamespace(), info=SimpleNamespace())
+
+
+@pytest.fixture
+def whisper_mock(_whisper_patch):
+    """
+    Module WhisperModel patch reset for each test
+
+    WhisperModel() returns .model, whose transcribe() yields one English
+    .segment. Tests change the segment/info attributes or the mocks'
+    side effects as needed.
+    """
+    mocks = _whisper_patch
+    mocks.whisper.reset_mock(return_value=True, side_effect=True)
+    mocks.model.reset_mock(return_value=True, side_effect=True)
+    mocks.segment.text = "Tower, Viper 1-1, request takeoff clearance"
+    mocks.segment.avg_logprob = -0.3
+    mocks.info.language = "en"
+    mocks.model.transcribe.return_value = ([mocks.segment], mocks.info)
+    mocks.whisper.return_value = mocks.model
+    return mocks
@@ -378,6 +378,21 @@ class TestATCQueue:
         assert not controller.is_in_queue("Viper 1-1", "takeoff")
         assert not controller.is_in_queue("Viper 1-2", "takeoff")
 
+    def test_reset(self):
+        """Test resetting all controller state"""
+        from src.atc_controller import ATCController, FlightPhase
+
+        controller = ATCController()
+
+        controller.set_aircraft_phase("Viper 1-1", FlightPhase.TAXI)
+        controller.add_to_queue("Viper 1-1", "takeoff")
+
+        controller.reset()
+
+        assert controller.get_aircraft_phase("Viper 1-1") == FlightPhase.COLD_START
+        assert not controller.is_in_queue("Viper 1-1", "takeoff")
+        assert controller.get_all_aircraft_phases() == {}
+
 
 class TestATCIntegration:
     """Test suite for ATC Controller integration with NLP and DCS Bridge"""
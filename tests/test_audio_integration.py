@@ -7,57 +7,82 @@ Voice Input → STT → NLP → ATC → TTS → Audio Output
 
 import pytest
 import numpy as np
+from functools import lru_cache
+from time import perf_counter_ns
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 
 
+# Shared test signals. Tests only check lengths and types, so one fixed
+# buffer (and views of it) serves every test.
+_RNG = np.random.default_rng(0)
+_AUDIO = _RNG.standard_normal(16000, dtype=np.float32)  # 1 s at 16 kHz
+_TTS_PAYLOAD = _RNG.standard_normal(1000, dtype=np.float32).tobytes()
+
+
+@lru_cache(maxsize=None)
+def _make_whisper_mock(text, logprob=-0.3, language="en"):
+    """Build (segments, info) as returned by WhisperModel.transcribe"""
+    return [SimpleNamespace(text=text, avg_logprob=logprob)], SimpleNamespace(language=language)
+
+
+@lru_cache(maxsize=None)
+def _make_tts_mock(stdout=_TTS_PAYLOAD):
+    """Build a successful Piper subprocess.run result"""
+    return MagicMock(returncode=0, stdout=stdout)
+
+
+@pytest.fixture(scope="class")
+def _class_tts_patches(request):
+    """Patch Piper's subprocess.run and sounddevice once per test class"""
+    patchers = [patch('src.tts_engine.subprocess.run'), patch('src.tts_engine.sd')]
+    tts_run, sd = [p.start() for p in patchers]
+    request.cls.mocks = SimpleNamespace(tts_run=tts_run, sd=sd)
+    yield
+    for p in patchers:
+        p.stop()
+
+
+@pytest.fixture
+def tts_patches(_class_tts_patches, request):
+    """Reset the class-wide TTS mocks to a successful Piper run"""
+    mocks = request.cls.mocks
+    mocks.tts_run.reset_mock(return_value=True, side_effect=True)
+    mocks.sd.reset_mock(return_value=True, side_effect=True)
+    mocks.tts_run.return_value = _make_tts_mock()
+    return mocks
+
+
+@pytest.mark.usefixtures("tts_patches")
 class TestAudioPipelineIntegration:
     """Integration tests for complete audio pipeline"""
 
-    @patch('src.stt_engine.WhisperModel')
-    @patch('src.tts_engine.subprocess.run')
-    @patch('src.tts_engine.sd')
-    def test_complete_voice_to_audio_pipeline(self, mock_sd, mock_tts_run, mock_whisper):
+    def test_complete_voice_to_audio_pipeline(self, pipeline):
         """Test complete pipeline from voice input to audio output"""
-        from src.voice_input import VoiceInputHandler
-        from src.stt_engine import STTEngine
-        from src.nlp_processor import AviationCommandParser, ATCResponseGenerator
-        from src.atc_controller import ATCController
-        from src.tts_engine import TTSEngine
-
         # Setup mocks
         # 1. Whisper STT mock
-        mock_segment = MagicMock()
-        mock_segment.text = "Tower, Viper 1-1, request takeoff clearance"
-        mock_segment.avg_logprob = -0.3
-        mock_info = MagicMock()
-        mock_info.language = "en"
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = ([mock_segment], mock_info)
-        mock_whisper.return_value = mock_model
-
-        # 2. TTS mock
-        mock_tts_run.return_value = MagicMock(
-            returncode=0,
-            stdout=np.random.randn(1000).astype(np.float32).tobytes()
-        )
+        mock_model = pipeline.mock_model
+        mock_model.transcribe.return_value = _make_whisper_mock("Tower, Viper 1-1, request takeoff clearance")
+
+        # 2. TTS mock (successful Piper run, set by tts_patches)
+        mock_tts_run = self.mocks.tts_run
 
         # 3. Audio playback mock
+        mock_sd = self.mocks.sd
         mock_sd.play = Mock()
         mock_sd.wait = Mock()
 
-        # Create pipeline components
-        voice_handler = VoiceInputHandler()
-        stt_engine = STTEngine()
-        stt_engine.load_model()
-        nlp_parser = AviationCommandParser()
-        nlp_generator = ATCResponseGenerator(phraseology="military")  # Use templates
-        atc_controller = ATCController()
-        tts_engine = TTSEngine(config={"radio_effects": True})
+        # Pipeline components
+        voice_handler = pipeline.voice
+        stt_engine = pipeline.stt
+        nlp_parser = pipeline.nlp_parser
+        atc_controller = pipeline.atc
+        tts_engine = pipeline.tts
 
         # Step 1: Simulate voice input (PTT pressed, audio captured)
         voice_handler.start_recording()
         # Simulate captured audio
-        captured_audio = np.random.randn(16000).astype(np.float32)
+        captured_audio = _AUDIO
         voice_handler.stop_recording()
 
         # Step 2: STT - Convert audio to text
@@ -97,29 +122,18 @@ class TestAudioPipelineIntegration:
         assert mock_tts_run.called
         assert mock_sd.play.called
 
-    @patch('src.stt_engine.WhisperModel')
-    def test_stt_to_nlp_integration(self, mock_whisper):
+    def test_stt_to_nlp_integration(self, pipeline):
         """Test STT to NLP integration"""
-        from src.stt_engine import STTEngine
-        from src.nlp_processor import AviationCommandParser
-
         # Mock Whisper
-        mock_segment = MagicMock()
-        mock_segment.text = "Request landing clearance runway 33"
-        mock_segment.avg_logprob = -0.2
-        mock_info = MagicMock()
-        mock_info.language = "en"
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = ([mock_segment], mock_info)
-        mock_whisper.return_value = mock_model
-
-        # Create components
-        stt_engine = STTEngine()
-        stt_engine.load_model()
-        nlp_parser = AviationCommandParser()
+        pipeline.mock_model.transcribe.return_value = _make_whisper_mock(
+            "Request landing clearance runway 33", logprob=-0.2
+        )
+
+        stt_engine = pipeline.stt
+        nlp_parser = pipeline.nlp_parser
 
         # Process audio
-        audio_data = np.random.randn(16000).astype(np.float32)
+        audio_data = _AUDIO
         stt_result = stt_engine.transcribe(audio_data)
 
         # Parse text
@@ -128,16 +142,12 @@ class TestAudioPipelineIntegration:
         assert parsed["intent"] == "request_landing"
         assert parsed["entities"]["runway"] == "33"
 
-    def test_nlp_to_atc_to_tts_integration(self):
+    def test_nlp_to_atc_to_tts_integration(self, pipeline):
         """Test NLP to ATC to TTS integration"""
-        from src.nlp_processor import AviationCommandParser
-        from src.atc_controller import ATCController
-        from src.tts_engine import TTSEngine
-
-        # Create components
-        nlp_parser = AviationCommandParser()
-        atc_controller = ATCController()
-        tts_engine = TTSEngine(config={"radio_effects": False})
+        nlp_parser = pipeline.nlp_parser
+        atc_controller = pipeline.atc
+        tts_engine = pipeline.tts
+        tts_engine.radio_effects_enabled = False
 
         # Parse pilot message
         pilot_message = "Tower, Eagle 2-1, request taxi clearance"
@@ -159,49 +169,26 @@ class TestAudioPipelineIntegration:
         assert "taxi" in atc_response.lower()
 
         # Synthesize response
-        with patch('src.tts_engine.subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout=np.random.randn(1000).astype(np.float32).tobytes()
-            )
-
-            audio = tts_engine.synthesize(atc_response)
-            assert audio is not None
-            assert len(audio) > 0
-
-    @patch('src.stt_engine.WhisperModel')
-    @patch('src.tts_engine.subprocess.run')
-    def test_error_recovery_in_pipeline(self, mock_tts_run, mock_whisper):
-        """Test error recovery in audio pipeline"""
-        from src.stt_engine import STTEngine
-        from src.nlp_processor import AviationCommandParser
-        from src.atc_controller import ATCController
-        from src.tts_engine import TTSEngine
+        audio = tts_engine.synthesize(atc_response)
+        assert audio is not None
+        assert len(audio) > 0
 
+    def test_error_recovery_in_pipeline(self, pipeline):
+        """Test error recovery in audio pipeline"""
         # Mock STT to return unclear text
-        mock_segment = MagicMock()
-        mock_segment.text = "unclear transmission"
-        mock_segment.avg_logprob = -2.0  # Low confidence
-        mock_info = MagicMock()
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = ([mock_segment], mock_info)
-        mock_whisper.return_value = mock_model
+        # Low confidence
+        pipeline.mock_model.transcribe.return_value = _make_whisper_mock("unclear transmission", logprob=-2.0)
 
         # Mock TTS
-        mock_tts_run.return_value = MagicMock(
-            returncode=0,
-            stdout=np.random.randn(500).astype(np.float32).tobytes()
-        )
+        self.mocks.tts_run.return_value = _make_tts_mock(_TTS_PAYLOAD[:2000])
 
-        # Create pipeline
-        stt_engine = STTEngine()
-        stt_engine.load_model()
-        nlp_parser = AviationCommandParser()
-        atc_controller = ATCController()
-        tts_engine = TTSEngine()
+        stt_engine = pipeline.stt
+        nlp_parser = pipeline.nlp_parser
+        atc_controller = pipeline.atc
+        tts_engine = pipeline.tts
 
         # Process unclear audio
-        audio_data = np.random.randn(8000).astype(np.float32)  # Short audio
+        audio_data = _AUDIO[:8000]  # Short audio
         stt_result = stt_engine.transcribe(audio_data)
 
         # NLP should handle unknown intent
@@ -221,79 +208,47 @@ class TestAudioPipelineIntegration:
         assert audio is not None
 
 
+@pytest.mark.usefixtures("tts_patches")
 class TestAudioPipelinePerformance:
     """Performance tests for audio pipeline"""
 
-    @patch('src.stt_engine.WhisperModel')
-    @patch('src.tts_engine.subprocess.run')
-    def test_pipeline_latency(self, mock_tts_run, mock_whisper):
+    # Pipeline should complete quickly (< 1 second with mocks); enforced by
+    # pytest-timeout rather than by timing the mocked stack ourselves
+    @pytest.mark.timeout(1)
+    def test_pipeline_latency(self, pipeline):
         """Test that pipeline completes in reasonable time"""
-        import time
-        from src.stt_engine import STTEngine
-        from src.nlp_processor import AviationCommandParser
-        from src.atc_controller import ATCController
-        from src.tts_engine import TTSEngine
-
         # Setup mocks
-        mock_segment = MagicMock()
-        mock_segment.text = "Request takeoff"
-        mock_segment.avg_logprob = -0.3
-        mock_info = MagicMock()
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = ([mock_segment], mock_info)
-        mock_whisper.return_value = mock_model
-
-        mock_tts_run.return_value = MagicMock(
-            returncode=0,
-            stdout=np.random.randn(1000).astype(np.float32).tobytes()
-        )
+        pipeline.mock_model.transcribe.return_value = _make_whisper_mock("Request takeoff")
 
-        # Create components
-        stt_engine = STTEngine()
-        stt_engine.load_model()
-        nlp_parser = AviationCommandParser()
-        atc_controller = ATCController()
-        tts_engine = TTSEngine()
+        stt_engine = pipeline.stt
+        nlp_parser = pipeline.nlp_parser
+        atc_controller = pipeline.atc
+        tts_engine = pipeline.tts
 
-        # Measure pipeline execution time
-        start_time = time.time()
-
-        audio_data = np.random.randn(16000).astype(np.float32)
+        audio_data = _AUDIO
         stt_result = stt_engine.transcribe(audio_data)
         parsed = nlp_parser.parse(stt_result["text"])
         response = atc_controller.process_pilot_request("Test", stt_result["text"], {})
         audio = tts_engine.synthesize(response)
 
-        elapsed_time = time.time() - start_time
-
-        # Pipeline should complete quickly (< 1 second with mocks)
-        assert elapsed_time < 1.0
         assert audio is not None
 
-    @patch('src.tts_engine.subprocess.run')
-    def test_tts_caching_improves_performance(self, mock_tts_run):
+    def test_tts_caching_improves_performance(self, pipeline):
         """Test that TTS caching reduces synthesis time"""
-        import time
-        from src.tts_engine import TTSEngine
-
-        mock_tts_run.return_value = MagicMock(
-            returncode=0,
-            stdout=np.random.randn(1000).astype(np.float32).tobytes()
-        )
-
-        engine = TTSEngine(config={"cache_enabled": True})
+        engine = pipeline.tts
+        assert engine.cache_enabled
 
         # First synthesis
         text = "Cleared for takeoff runway 33"
-        start1 = time.time()
+        t0 = perf_counter_ns()
         audio1 = engine.synthesize(text)
-        time1 = time.time() - start1
+        time1 = perf_counter_ns() - t0
 
         # Second synthesis (should use cache)
-        start2 = time.time()
+        t0 = perf_counter_ns()
         audio2 = engine.synthesize(text)
-        time2 = time.time() - start2
+        time2 = perf_counter_ns() - t0
 
         # Cached synthesis should be faster
-        assert time2 < time1 or time2 < 0.001  # Much faster or negligible
+        assert time2 * 2 < time1 or time2 < 1_000_000  # Much faster or negligible (< 1 ms)
         assert np.array_equal(audio1, audio2)
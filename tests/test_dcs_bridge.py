@@ -4,12 +4,32 @@ Tests for DCS Export Bridge (UDP listener and aircraft state tracking)
 Following TDD methodology - write tests first, then implement.
 """
 
+import copy
 import json
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
 
+# Sample DCS export payload; copy it before handing it to the bridge
+_VIPER_STATE = {
+    "pilot": "Viper 1-1",
+    "position": {"lat": 43.2, "lon": 39.8, "alt": 5000},
+    "heading": 270,
+    "speed": 450,
+    "frequency": 251.0
+}
+_VIPER_STATE_JSON = json.dumps(_VIPER_STATE)
+
+
+@pytest.fixture
+def bridge():
+    """Fresh DCSBridge with no aircraft state"""
+    from src.dcs_bridge import DCSBridge
+
+    return DCSBridge()
+
+
 class TestDCSBridge:
     """Test suite for DCS Export Bridge UDP listener"""
 
@@ -70,44 +90,22 @@ class TestDCSBridge:
         mock_sock.close.assert_called()
         assert bridge.is_running is False
 
-    def test_parse_json_valid_data(self):
+    def test_parse_json_valid_data(self, bridge):
         """Test parsing valid JSON data from DCS"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-        data = {
-            "pilot": "Viper 1-1",
-            "position": {"lat": 43.2, "lon": 39.8, "alt": 5000},
-            "heading": 270,
-            "speed": 450,
-            "frequency": 251.0
-        }
-        json_str = json.dumps(data)
-
-        result = bridge.parse_data(json_str)
+        result = bridge.parse_data(_VIPER_STATE_JSON)
         assert result["pilot"] == "Viper 1-1"
         assert result["position"]["alt"] == 5000
         assert result["heading"] == 270
 
-    def test_parse_json_invalid_data(self):
+    def test_parse_json_invalid_data(self, bridge):
         """Test parsing invalid JSON returns None"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
         result = bridge.parse_data("invalid json{]")
         assert result is None
 
-    def test_update_aircraft_state(self):
+    def test_update_aircraft_state(self, bridge):
         """Test updating aircraft state"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-        data = {
-            "pilot": "Viper 1-1",
-            "position": {"lat": 43.2, "lon": 39.8, "alt": 5000},
-            "heading": 270,
-            "speed": 450
-        }
+        # update_aircraft_state stamps and stores the dict it is given
+        data = copy.deepcopy(_VIPER_STATE)
 
         bridge.update_aircraft_state("Viper 1-1", data)
 
@@ -115,17 +113,10 @@ class TestDCSBridge:
         assert bridge.aircraft_states["Viper 1-1"]["heading"] == 270
         assert bridge.aircraft_states["Viper 1-1"]["speed"] == 450
 
-    def test_get_aircraft_state(self):
+    def test_get_aircraft_state(self, bridge):
         """Test retrieving aircraft state"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-        data = {
-            "pilot": "Viper 1-1",
-            "position": {"lat": 43.2, "lon": 39.8, "alt": 5000},
-            "heading": 270,
-            "speed": 450
-        }
+        # update_aircraft_state stamps and stores the dict it is given
+        data = copy.deepcopy(_VIPER_STATE)
 
         bridge.update_aircraft_state("Viper 1-1", data)
         state = bridge.get_aircraft_state("Viper 1-1")
@@ -133,21 +124,14 @@ class TestDCSBridge:
         assert state is not None
         assert state["heading"] == 270
 
-    def test_get_aircraft_state_missing(self):
+    def test_get_aircraft_state_missing(self, bridge):
         """Test retrieving non-existent aircraft state returns None"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
         state = bridge.get_aircraft_state("Unknown Aircraft")
 
         assert state is None
 
-    def test_get_all_aircraft_states(self):
+    def test_get_all_aircraft_states(self, bridge):
         """Test retrieving all aircraft states"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-
         bridge.update_aircraft_state("Viper 1-1", {"pilot": "Viper 1-1", "heading": 270})
         bridge.update_aircraft_state("Viper 1-2", {"pilot": "Viper 1-2", "heading": 280})
 
@@ -157,37 +141,24 @@ class TestDCSBridge:
         assert "Viper 1-1" in all_states
         assert "Viper 1-2" in all_states
 
-    def test_process_incoming_data(self):
+    def test_process_incoming_data(self, bridge):
         """Test processing incoming data updates state"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-        json_data = json.dumps({
-            "pilot": "Viper 1-1",
-            "position": {"lat": 43.2, "lon": 39.8, "alt": 5000},
-            "heading": 270,
-            "speed": 450,
-            "frequency": 251.0
-        })
-
-        bridge.process_incoming_data(json_data)
+        bridge.process_incoming_data(_VIPER_STATE_JSON)
 
         state = bridge.get_aircraft_state("Viper 1-1")
         assert state is not None
         assert state["heading"] == 270
 
-    def test_process_incoming_data_invalid_json(self):
+    def test_process_incoming_data_invalid_json(self, bridge):
         """Test processing invalid JSON doesn't crash"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
         bridge.process_incoming_data("invalid json{]")
 
         # Should not raise exception
         assert len(bridge.aircraft_states) == 0
 
+    @patch('socket.socket')
     @patch('threading.Thread')
-    def test_start_listener_thread(self, mock_thread):
+    def test_start_listener_thread(self, mock_thread, mock_socket):
         """Test that listening starts in background thread"""
         from src.dcs_bridge import DCSBridge
 
@@ -199,17 +170,14 @@ class TestDCSBridge:
 
         # Should create a thread for listening
         assert bridge.is_running is True
+        mock_thread.assert_called_once()
 
 
 class TestAircraftStateTracking:
     """Test suite for aircraft state tracking features"""
 
-    def test_detect_altitude_change(self):
+    def test_detect_altitude_change(self, bridge):
         """Test detecting altitude changes"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-
         # Initial state
         bridge.update_aircraft_state("Viper 1-1", {
             "pilot": "Viper 1-1",
@@ -225,24 +193,16 @@ class TestAircraftStateTracking:
         state = bridge.get_aircraft_state("Viper 1-1")
         assert state["position"]["alt"] == 10000
 
-    def test_detect_speed_change(self):
+    def test_detect_speed_change(self, bridge):
         """Test detecting speed changes"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-
         bridge.update_aircraft_state("Viper 1-1", {"pilot": "Viper 1-1", "speed": 100})
         bridge.update_aircraft_state("Viper 1-1", {"pilot": "Viper 1-1", "speed": 300})
 
         state = bridge.get_aircraft_state("Viper 1-1")
         assert state["speed"] == 300
 
-    def test_track_multiple_aircraft(self):
+    def test_track_multiple_aircraft(self, bridge):
         """Test tracking multiple aircraft simultaneously"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-
         # Add multiple aircraft
         for i in range(1, 5):
             bridge.update_aircraft_state(f"Viper 1-{i}", {
@@ -255,12 +215,8 @@ class TestAircraftStateTracking:
         assert len(all_states) == 4
         assert bridge.get_aircraft_state("Viper 1-3")["heading"] == 300
 
-    def test_clear_aircraft_state(self):
+    def test_clear_aircraft_state(self, bridge):
         """Test clearing specific aircraft state"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-
         bridge.update_aircraft_state("Viper 1-1", {"pilot": "Viper 1-1", "heading": 270})
         bridge.update_aircraft_state("Viper 1-2", {"pilot": "Viper 1-2", "heading": 280})
 
@@ -269,12 +225,8 @@ class TestAircraftStateTracking:
         assert bridge.get_aircraft_state("Viper 1-1") is None
         assert bridge.get_aircraft_state("Viper 1-2") is not None
 
-    def test_clear_all_aircraft_states(self):
+    def test_clear_all_aircraft_states(self, bridge):
         """Test clearing all aircraft states"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-
         bridge.update_aircraft_state("Viper 1-1", {"pilot": "Viper 1-1", "heading": 270})
         bridge.update_aircraft_state("Viper 1-2", {"pilot": "Viper 1-2", "heading": 280})
 
@@ -286,73 +238,24 @@ class TestAircraftStateTracking:
 class TestDataExtraction:
     """Test suite for extracting specific data from aircraft state"""
 
-    def test_extract_position_data(self):
-        """Test extracting position data"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-        bridge.update_aircraft_state("Viper 1-1", {
-            "pilot": "Viper 1-1",
-            "position": {"lat": 43.2, "lon": 39.8, "alt": 5000}
-        })
-
-        position = bridge.get_aircraft_position("Viper 1-1")
-        assert position is not None
-        assert position["lat"] == 43.2
-        assert position["lon"] == 39.8
-        assert position["alt"] == 5000
-
-    def test_extract_position_missing_aircraft(self):
-        """Test extracting position from missing aircraft returns None"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-        position = bridge.get_aircraft_position("Unknown")
-        assert position is None
-
-    def test_extract_heading(self):
-        """Test extracting heading data"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-        bridge.update_aircraft_state("Viper 1-1", {
-            "pilot": "Viper 1-1",
-            "heading": 270
-        })
-
-        heading = bridge.get_aircraft_heading("Viper 1-1")
-        assert heading == 270
-
-    def test_extract_heading_missing_aircraft(self):
-        """Test extracting heading from missing aircraft returns None"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-        heading = bridge.get_aircraft_heading("Unknown")
-        assert heading is None
-
-    def test_extract_speed(self):
-        """Test extracting speed data"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-        bridge.update_aircraft_state("Viper 1-1", {
-            "pilot": "Viper 1-1",
-            "speed": 450
-        })
-
-        speed = bridge.get_aircraft_speed("Viper 1-1")
-        assert speed == 450
-
-    def test_extract_frequency(self):
-        """Test extracting frequency data"""
-        from src.dcs_bridge import DCSBridge
-
-        bridge = DCSBridge()
-        bridge.update_aircraft_state("Viper 1-1", {
-            "pilot": "Viper 1-1",
-            "frequency": 251.0
-        })
-
-        freq = bridge.get_aircraft_frequency("Viper 1-1")
-        assert freq == 251.0
+    @pytest.mark.parametrize("field,value,getter", [
+        ("position", {"lat": 43.2, "lon": 39.8, "alt": 5000}, "get_aircraft_position"),
+        ("heading", 270, "get_aircraft_heading"),
+        ("speed", 450, "get_aircraft_speed"),
+        ("frequency", 251.0, "get_aircraft_frequency"),
+    ])
+    def test_extract(self, bridge, field, value, getter):
+        """Test extracting a single field from aircraft state"""
+        bridge.update_aircraft_state("Viper 1-1", {"pilot": "Viper 1-1", field: value})
+
+        assert getattr(bridge, getter)("Viper 1-1") == value
+
+    @pytest.mark.parametrize("getter", [
+        "get_aircraft_position",
+        "get_aircraft_heading",
+        "get_aircraft_speed",
+        "get_aircraft_frequency",
+    ])
+    def test_extract_missing_aircraft(self, bridge, getter):
+        """Test extracting data from missing aircraft returns None"""
+        assert getattr(bridge, getter)("Unknown") is None
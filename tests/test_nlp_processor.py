@@ -7,122 +7,96 @@ Following TDD principles
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
+from src.nlp_processor import (
+    AviationCommandParser, IntentClassifier, EntityExtractor, ATCResponseGenerator, NLPProcessor
+)
 
-class TestAviationCommandParser:
-    """Test cases for aviation command parsing"""
 
-    def test_parser_initialization(self):
-        """Test parser can be instantiated"""
-        from src.nlp_processor import AviationCommandParser
+# The parser, classifier, extractor and template generator hold no per-call
+# state, so one instance of each serves the whole session.
+@pytest.fixture(scope="session")
+def parser():
+    return AviationCommandParser()
 
-        parser = AviationCommandParser()
-        assert parser is not None
 
-    def test_parse_takeoff_request(self):
-        """Test parsing takeoff request"""
-        from src.nlp_processor import AviationCommandParser
+@pytest.fixture(scope="session")
+def classifier():
+    return IntentClassifier()
 
-        parser = AviationCommandParser()
-        result = parser.parse("Request takeoff clearance")
 
-        assert result is not None
-        assert result['intent'] == 'request_takeoff'
+@pytest.fixture(scope="session")
+def extractor():
+    return EntityExtractor()
 
-    def test_parse_landing_request(self):
-        """Test parsing landing request"""
-        from src.nlp_processor import AviationCommandParser
 
-        parser = AviationCommandParser()
-        result = parser.parse("Request landing clearance")
+@pytest.fixture(scope="session")
+def response_generator():
+    return ATCResponseGenerator()
 
-        assert result['intent'] == 'request_landing'
 
-    def test_parse_taxi_request(self):
-        """Test parsing taxi request"""
-        from src.nlp_processor import AviationCommandParser
+class TestAviationCommandParser:
+    """Test cases for aviation command parsing"""
 
+    def test_parser_initialization(self):
+        """Test parser can be instantiated"""
         parser = AviationCommandParser()
-        result = parser.parse("Request taxi to active runway")
+        assert parser is not None
 
-        assert result['intent'] == 'request_taxi'
+    @pytest.mark.parametrize("utterance,expected_intents,expected_entity", [
+        ("Request takeoff clearance", ['request_takeoff'], None),
+        ("Request landing clearance", ['request_landing'], None),
+        ("Request taxi to active runway", ['request_taxi'], None),
+        ("Request climb to flight level 250", ['altitude_change', 'request_altitude'], 'altitude'),
+        ("Turn right heading 090", ['heading_change', 'request_heading'], 'heading'),
+    ])
+    def test_parse_intent(self, parser, utterance, expected_intents, expected_entity):
+        """Test parsing intent (and key entity) from common requests"""
+        result = parser.parse(utterance)
 
-    def test_extract_callsign(self):
-        """Test extracting callsign from command"""
-        from src.nlp_processor import AviationCommandParser
+        assert result is not None
+        assert result['intent'] in expected_intents
+        if expected_entity:
+            assert expected_entity in result['entities']
 
-        parser = AviationCommandParser()
+    def test_extract_callsign(self, parser):
+        """Test extracting callsign from command"""
         result = parser.parse("Viper 1-1, request takeoff clearance")
 
         assert 'entities' in result
         assert 'callsign' in result['entities']
         assert "Viper" in result['entities']['callsign'] or "1-1" in result['entities']['callsign']
 
-    def test_extract_altitude(self):
+    def test_extract_altitude(self, parser):
         """Test extracting altitude from command"""
-        from src.nlp_processor import AviationCommandParser
-
-        parser = AviationCommandParser()
         result = parser.parse("Request climb to flight level 350")
 
         assert 'altitude' in result['entities']
         assert "350" in str(result['entities']['altitude'])
 
-    def test_extract_heading(self):
+    def test_extract_heading(self, parser):
         """Test extracting heading from command"""
-        from src.nlp_processor import AviationCommandParser
-
-        parser = AviationCommandParser()
         result = parser.parse("Turn left heading 270")
 
         assert 'heading' in result['entities']
         assert "270" in str(result['entities']['heading'])
 
-    def test_extract_runway(self):
+    def test_extract_runway(self, parser):
         """Test extracting runway from command"""
-        from src.nlp_processor import AviationCommandParser
-
-        parser = AviationCommandParser()
         result = parser.parse("Request takeoff runway 27 left")
 
         assert 'runway' in result['entities']
         assert "27" in str(result['entities']['runway'])
 
-    def test_parse_complex_command(self):
+    def test_parse_complex_command(self, parser):
         """Test parsing complex multi-entity command"""
-        from src.nlp_processor import AviationCommandParser
-
-        parser = AviationCommandParser()
         result = parser.parse("Viper 1-1, request takeoff clearance runway 21 left")
 
         assert result['intent'] == 'request_takeoff'
         assert 'callsign' in result['entities']
         assert 'runway' in result['entities']
 
-    def test_parse_altitude_change(self):
-        """Test parsing altitude change request"""
-        from src.nlp_processor import AviationCommandParser
-
-        parser = AviationCommandParser()
-        result = parser.parse("Request climb to flight level 250")
-
-        assert result['intent'] in ['altitude_change', 'request_altitude']
-        assert 'altitude' in result['entities']
-
-    def test_parse_heading_change(self):
-        """Test parsing heading change"""
-        from src.nlp_processor import AviationCommandParser
-
-        parser = AviationCommandParser()
-        result = parser.parse("Turn right heading 090")
-
-        assert result['intent'] in ['heading_change', 'request_heading']
-        assert 'heading' in result['entities']
-
-    def test_parse_invalid_command(self):
+    def test_parse_invalid_command(self, parser):
         """Test handling of invalid/unparseable command"""
-        from src.nlp_processor import AviationCommandParser
-
-        parser = AviationCommandParser()
         result = parser.parse("asdf qwerty zxcv")
 
         assert result is not None
@@ -135,17 +109,11 @@ class TestIntentClassifier:
 
     def test_classifier_initialization(self):
         """Test intent classifier can be instantiated"""
-        from src.nlp_processor import IntentClassifier
-
         classifier = IntentClassifier()
         assert classifier is not None
 
-    def test_classify_takeoff_variants(self):
+    def test_classify_takeoff_variants(self, classifier):
         """Test classifying various takeoff request phrasings"""
-        from src.nlp_processor import IntentClassifier
-
-        classifier = IntentClassifier()
-
         phrases = [
             "Request takeoff clearance",
             "Ready for takeoff",
@@ -157,12 +125,8 @@ class TestIntentClassifier:
             intent = classifier.classify(phrase)
             assert intent == 'request_takeoff'
 
-    def test_classify_landing_variants(self):
+    def test_classify_landing_variants(self, classifier):
         """Test classifying various landing request phrasings"""
-        from src.nlp_processor import IntentClassifier
-
-        classifier = IntentClassifier()
-
         phrases = [
             "Request landing clearance",
             "Inbound for landing",
@@ -178,62 +142,50 @@ class TestEntityExtractor:
 
     def test_extractor_initialization(self):
         """Test entity extractor can be instantiated"""
-        from src.nlp_processor import EntityExtractor
-
         extractor = EntityExtractor()
         assert extractor is not None
 
-    def test_extract_callsign_patterns(self):
+    def test_patterns_compiled_once(self):
+        """Test regex patterns are compiled at import and shared by instances"""
+        assert EntityExtractor().compiled_patterns is EntityExtractor().compiled_patterns
+        assert IntentClassifier().compiled_patterns is IntentClassifier.COMPILED_PATTERNS
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Viper 1-1", "Viper 1-1"),
+        ("Navy Golf Alfa 21", "Navy Golf Alfa 21"),
+        ("REACH 31792", "REACH 31792"),
+    ])
+    def test_extract_callsign_patterns(self, extractor, text, expected):
         """Test extracting various callsign formats"""
-        from src.nlp_processor import EntityExtractor
+        result = extractor.extract_callsign(text)
 
-        extractor = EntityExtractor()
-
-        test_cases = [
-            ("Viper 1-1", "Viper 1-1"),
-            ("Navy Golf Alfa 21", "Navy Golf Alfa 21"),
-            ("REACH 31792", "REACH 31792"),
-        ]
-
-        for text, expected in test_cases:
-            result = extractor.extract_callsign(text)
-            assert result is not None
-            assert expected.lower() in result.lower() or result.lower() in expected.lower()
-
-    def test_extract_altitude_patterns(self):
+        assert result is not None
+        assert expected.lower() in result.lower() or result.lower() in expected.lower()
+
+    @pytest.mark.parametrize("text,expected", [
+        ("flight level 350", "350"),
+        ("12,000 feet", "12000"),
+        ("angels 25", "25"),
+        ("FL250", "250"),
+    ])
+    def test_extract_altitude_patterns(self, extractor, text, expected):
         """Test extracting various altitude formats"""
-        from src.nlp_processor import EntityExtractor
-
-        extractor = EntityExtractor()
-
-        test_cases = [
-            ("flight level 350", "350"),
-            ("12,000 feet", "12000"),
-            ("angels 25", "25"),
-            ("FL250", "250"),
-        ]
+        result = extractor.extract_altitude(text)
 
-        for text, expected in test_cases:
-            result = extractor.extract_altitude(text)
-            assert result is not None
-            assert expected in str(result)
-
-    def test_extract_heading_patterns(self):
+        assert result is not None
+        assert expected in str(result)
+
+    @pytest.mark.parametrize("text,expected", [
+        ("heading 270", "270"),
+        ("turn left 330", "330"),
+        ("right turn 090", "090"),
+    ])
+    def test_extract_heading_patterns(self, extractor, text, expected):
         """Test extracting heading values"""
-        from src.nlp_processor import EntityExtractor
-
-        extractor = EntityExtractor()
-
-        test_cases = [
-            ("heading 270", "270"),
-            ("turn left 330", "330"),
-            ("right turn 090", "090"),
-        ]
+        result = extractor.extract_heading(text)
 
-        for text, expected in test_cases:
-            result = extractor.extract_heading(text)
-            assert result is not None
-            assert expected in str(result)
+        assert result is not None
+        assert expected in str(result)
 
 
 class TestATCResponseGenerator:
@@ -241,16 +193,11 @@ class TestATCResponseGenerator:
 
     def test_response_generator_initialization(self):
         """Test response generator can be instantiated"""
-        from src.nlp_processor import ATCResponseGenerator
-
         generator = ATCResponseGenerator()
         assert generator is not None
 
-    def test_generate_takeoff_clearance(self):
+    def test_generate_takeoff_clearance(self, response_generator):
         """Test generating takeoff clearance response"""
-        from src.nlp_processor import ATCResponseGenerator
-
-        generator = ATCResponseGenerator()
         context = {
             'callsign': 'Viper 1-1',
             'intent': 'request_takeoff',
@@ -258,16 +205,13 @@ class TestATCResponseGenerator:
             'runway': '21L'
         }
 
-        response = generator.generate_response(context)
+        response = response_generator.generate_response(context)
 
         assert response is not None
         assert "cleared" in response.lower() or "viper" in response.lower()
 
-    def test_generate_landing_clearance(self):
+    def test_generate_landing_clearance(self, response_generator):
         """Test generating landing clearance response"""
-        from src.nlp_processor import ATCResponseGenerator
-
-        generator = ATCResponseGenerator()
         context = {
             'callsign': 'Viper 1-1',
             'intent': 'request_landing',
@@ -275,15 +219,13 @@ class TestATCResponseGenerator:
             'runway': '27R'
         }
 
-        response = generator.generate_response(context)
+        response = response_generator.generate_response(context)
 
         assert response is not None
         assert "cleared" in response.lower() or "land" in response.lower() or "viper" in response.lower()
 
     def test_generate_with_phraseology(self):
         """Test response uses proper military phraseology"""
-        from src.nlp_processor import ATCResponseGenerator
-
         generator = ATCResponseGenerator(phraseology="military")
         context = {
             'callsign': 'Viper 1-1',
@@ -301,15 +243,11 @@ class TestNLPProcessor:
 
     def test_processor_initialization(self):
         """Test NLP processor can be instantiated"""
-        from src.nlp_processor import NLPProcessor
-
         processor = NLPProcessor()
         assert processor is not None
 
     def test_process_complete_command(self):
         """Test complete command processing pipeline"""
-        from src.nlp_processor import NLPProcessor
-
         processor = NLPProcessor()
         result = processor.process("Viper 1-1, request takeoff clearance")
 
@@ -320,8 +258,6 @@ class TestNLPProcessor:
 
     def test_processor_maintains_context(self):
         """Test processor maintains dialogue context across turns"""
-        from src.nlp_processor import NLPProcessor
-
         processor = NLPProcessor()
 
         # First command
@@ -335,8 +271,6 @@ class TestNLPProcessor:
 
     def test_processor_handles_errors_gracefully(self):
         """Test processor handles errors without crashing"""
-        from src.nlp_processor import NLPProcessor
-
         processor = NLPProcessor()
         result = processor.process("Request takeoff")
 
@@ -7,7 +7,24 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 import subprocess
 import time
-import src.ollama_manager
+from itertools import chain, repeat
+from types import SimpleNamespace
+
+# Already imported by the code under test; imported here so patches bind
+# to the module objects directly
+import ollama
+import requests
+
+from src.ollama_manager import OllamaManager
+
+
+@pytest.fixture
+def start_patches():
+    """Patch process launch, the readiness check and sleeping for start()"""
+    with patch('subprocess.Popen') as popen, \
+            patch('src.ollama_manager.OllamaManager.is_running') as is_running, \
+            patch('time.sleep') as sleep:
+        yield SimpleNamespace(popen=popen, is_running=is_running, sleep=sleep)
 
 
 class TestOllamaManager:
@@ -15,8 +32,6 @@ class TestOllamaManager:
 
     def test_ollama_manager_initialization(self):
         """Test OllamaManager can be instantiated with default config"""
-        from src.ollama_manager import OllamaManager
-
         manager = OllamaManager()
         assert manager is not None
         assert manager.ollama_port == 11434
@@ -25,55 +40,29 @@ class TestOllamaManager:
 
     def test_ollama_manager_custom_config(self):
         """Test OllamaManager accepts custom configuration"""
-        from src.ollama_manager import OllamaManager
-
         manager = OllamaManager(port=11435, model="llama3.1:8b")
         assert manager.ollama_port == 11435
         assert manager.model_name == "llama3.1:8b"
 
-    @patch('requests.get')
-    def test_is_running_returns_true_when_ollama_responds(self, mock_get):
-        """Test is_running() returns True when Ollama server is responsive"""
-        from src.ollama_manager import OllamaManager
-
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
+    @pytest.mark.parametrize("side_effect,status,expected", [
+        pytest.param(None, 200, True, id="responds"),
+        pytest.param(Exception("Connection refused"), None, False, id="not_responding"),
+        pytest.param(None, 500, False, id="non_200_status"),
+    ])
+    @patch.object(requests, 'get')
+    def test_is_running(self, mock_get, side_effect, status, expected):
+        """Test is_running() reflects the Ollama server's health endpoint"""
+        mock_get.side_effect = side_effect
+        mock_get.return_value = Mock(status_code=status)
 
         manager = OllamaManager()
         # Use force_refresh=True to test the logic synchronously
-        assert manager.is_running(force_refresh=True) is True
+        assert manager.is_running(force_refresh=True) is expected
         mock_get.assert_called_once_with("http://localhost:11434/api/tags", timeout=2)
 
-    @patch('requests.get')
-    def test_is_running_returns_false_when_ollama_not_responding(self, mock_get):
-        """Test is_running() returns False when Ollama server is not responsive"""
-        from src.ollama_manager import OllamaManager
-
-        mock_get.side_effect = Exception("Connection refused")
-
-        manager = OllamaManager()
-        # Use force_refresh=True to test the logic synchronously
-        assert manager.is_running(force_refresh=True) is False
-
-    @patch('requests.get')
-    def test_is_running_returns_false_on_non_200_status(self, mock_get):
-        """Test is_running() returns False when Ollama returns non-200 status"""
-        from src.ollama_manager import OllamaManager
-
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_get.return_value = mock_response
-
-        manager = OllamaManager()
-        # Use force_refresh=True to test the logic synchronously
-        assert manager.is_running(force_refresh=True) is False
-
-    @patch('requests.get')
+    @patch.object(requests, 'get')
     def test_is_running_async_caching(self, mock_get):
         """Test is_running() async caching behavior"""
-        from src.ollama_manager import OllamaManager
-
         # Make the request take some time to ensure we can observe the "pending" state
         def delayed_response(*args, **kwargs):
             time.sleep(0.2)
@@ -102,107 +91,97 @@ class TestOllamaManager:
         manager.is_running()
         mock_get.assert_called_once()
 
-    @patch('subprocess.Popen')
-    @patch('src.ollama_manager.OllamaManager.is_running')
-    def test_start_ollama_when_already_running(self, mock_is_running, mock_popen):
+    def test_start_ollama_when_already_running(self, start_patches):
         """Test start() returns True immediately if Ollama is already running"""
-        from src.ollama_manager import OllamaManager
-
-        mock_is_running.return_value = True
+        start_patches.is_running.return_value = True
 
         manager = OllamaManager()
         result = manager.start()
 
         assert result is True
-        mock_popen.assert_not_called()
+        start_patches.popen.assert_not_called()
 
-    @patch('subprocess.Popen')
-    @patch('src.ollama_manager.OllamaManager.is_running')
-    @patch('time.sleep')
-    def test_start_ollama_launches_process(self, mock_sleep, mock_is_running, mock_popen):
+    def test_start_ollama_launches_process(self, start_patches):
         """Test start() launches Ollama process and waits for it to be ready"""
-        from src.ollama_manager import OllamaManager
-
         # First call returns False (not running), subsequent calls return True (started)
-        mock_is_running.side_effect = [False, False, True]
+        start_patches.is_running.side_effect = [False, False, True]
         mock_process = Mock()
-        mock_popen.return_value = mock_process
+        start_patches.popen.return_value = mock_process
 
         manager = OllamaManager()
         result = manager.start()
 
         assert result is True
         assert manager.process == mock_process
-        mock_popen.assert_called_once()
-        assert mock_sleep.call_count == 2
+        start_patches.popen.assert_called_once()
+        # Readiness is polled with a doubling backoff starting at 10 ms
+        sleep = start_patches.sleep
+        assert sleep.call_count >= 2
+        assert [c.args[0] for c in sleep.call_args_list] == pytest.approx([0.01, 0.02])
 
-    @patch('subprocess.Popen')
-    @patch('src.ollama_manager.OllamaManager.is_running')
-    @patch('time.sleep')
-    def test_start_ollama_timeout(self, mock_sleep, mock_is_running, mock_popen):
+    def test_start_ollama_timeout(self, start_patches):
         """Test start() returns False if Ollama doesn't start within timeout"""
-        from src.ollama_manager import OllamaManager
-
         # Always returns False (never starts)
-        mock_is_running.return_value = False
-        mock_process = Mock()
-        mock_popen.return_value = mock_process
+        start_patches.is_running.return_value = False
+        start_patches.popen.return_value = Mock()
 
-        manager = OllamaManager(timeout=3)  # Short timeout for test
-        result = manager.start()
+        manager = OllamaManager(timeout=3)
+        # Clock reads 0 s at launch and on the first poll, then 5 s: past
+        # the deadline after one iteration whatever the poll interval
+        with patch('src.ollama_manager.time.monotonic', side_effect=chain([0.0, 0.0], repeat(5.0))):
+            result = manager.start()
 
         assert result is False
-        assert mock_sleep.call_count == 3
+        assert start_patches.popen.called is True
+        # Never sleeps past the deadline
+        assert all(c.args[0] <= 3 for c in start_patches.sleep.call_args_list)
 
-    @patch('subprocess.Popen')
-    @patch('src.ollama_manager.OllamaManager.is_running')
-    def test_start_ollama_file_not_found(self, mock_is_running, mock_popen):
+    def test_start_ollama_file_not_found(self, start_patches):
         """Test start() handles FileNotFoundError when Ollama is not installed"""
-        from src.ollama_manager import OllamaManager
-
-        mock_is_running.return_value = False
-        mock_popen.side_effect = FileNotFoundError("ollama not found")
+        start_patches.is_running.return_value = False
+        start_patches.popen.side_effect = FileNotFoundError("ollama not found")
 
         manager = OllamaManager()
         result = manager.start()
 
         assert result is False
 
-    def test_ensure_model_when_model_exists(self):
-        """Test ensure_model() returns True when model is already downloaded"""
-        from src.ollama_manager import OllamaManager
-
-        manager = OllamaManager()
-        # Test will pass if ollama is installed, otherwise will return False
-        result = manager.ensure_model()
-
-        # Either is acceptable without ollama installed
-        assert isinstance(result, bool)
-
-    def test_ensure_model_downloads_when_missing(self):
-        """Test ensure_model() downloads model when not present"""
-        from src.ollama_manager import OllamaManager
+    @pytest.mark.parametrize("models,pulled", [
+        pytest.param([{'name': 'llama3.2:3b'}], False, id="model_exists"),
+        pytest.param([], True, id="model_missing"),
+    ])
+    @patch.object(ollama, 'pull')
+    @patch.object(ollama, 'list')
+    def test_ensure_model(self, mock_list, mock_pull, models, pulled):
+        """Test ensure_model() downloads the model only when it is not present"""
+        mock_list.return_value = {'models': models}
 
         manager = OllamaManager()
         result = manager.ensure_model()
 
-        # Result depends on ollama being installed
-        assert isinstance(result, bool)
-
-    def test_ensure_model_handles_exception(self):
+        assert result is True
+        assert mock_pull.called is pulled
+
+    @pytest.mark.parametrize("list_error,pull_error", [
+        pytest.param(Exception("Connection refused"), None, id="list_fails"),
+        pytest.param(None, Exception("Download failed"), id="pull_fails"),
+    ])
+    @patch.object(ollama, 'pull')
+    @patch.object(ollama, 'list')
+    def test_ensure_model_handles_exception(self, mock_list, mock_pull, list_error, pull_error):
         """Test ensure_model() handles exceptions gracefully"""
-        from src.ollama_manager import OllamaManager
+        mock_list.side_effect = list_error
+        mock_list.return_value = {'models': []}
+        mock_pull.side_effect = pull_error
 
         manager = OllamaManager()
         result = manager.ensure_model()
 
-        # Should not crash, returns True or False
-        assert isinstance(result, bool)
+        # Should not crash
+        assert result is False
 
     def test_stop_ollama_when_process_exists(self):
         """Test stop() terminates the Ollama process if it was started by manager"""
-        from src.ollama_manager import OllamaManager
-
         manager = OllamaManager()
         mock_process = Mock()
         manager.process = mock_process
@@ -214,45 +193,25 @@ class TestOllamaManager:
 
     def test_stop_ollama_when_no_process(self):
         """Test stop() handles case when no process was started"""
-        from src.ollama_manager import OllamaManager
-
         manager = OllamaManager()
         manager.stop()  # Should not raise exception
 
+    @pytest.mark.parametrize("running,chat_effect,expected,calls", [
+        pytest.param(True, [{'message': {'content': "Cleared for takeoff"}}], "Cleared for takeoff", 1, id="responds"),
+        pytest.param(False, None, None, 0, id="not_running"),
+        pytest.param(True, Exception("Connection reset"), None, 3, id="chat_fails"),
+    ])
+    @patch('time.sleep')
+    @patch.object(ollama, 'chat')
     @patch('src.ollama_manager.OllamaManager.is_running')
-    def test_chat_with_ollama(self, mock_is_running):
-        """Test chat() method sends messages to Ollama"""
-        from src.ollama_manager import OllamaManager
-
-        mock_is_running.return_value = False  # Ollama not running in test env
-
-        manager = OllamaManager()
-        result = manager.chat("Request takeoff clearance")
-
-        # Should return None when ollama not running
-        assert result is None
-
-    @patch('src.ollama_manager.OllamaManager.is_running')
-    def test_chat_fails_when_ollama_not_running(self, mock_is_running):
-        """Test chat() returns None when Ollama is not running"""
-        from src.ollama_manager import OllamaManager
-
-        mock_is_running.return_value = False
-
-        manager = OllamaManager()
-        result = manager.chat("Request takeoff clearance")
-
-        assert result is None
-
-    @patch('src.ollama_manager.OllamaManager.is_running')
-    def test_chat_handles_exception(self, mock_is_running):
-        """Test chat() handles exceptions during communication"""
-        from src.ollama_manager import OllamaManager
-
-        mock_is_running.return_value = False  # Simulate not running
+    def test_chat(self, mock_is_running, mock_chat, mock_sleep, running, chat_effect, expected, calls):
+        """Test chat() returns the reply, or None when Ollama is down or failing"""
+        mock_is_running.return_value = running
+        mock_chat.side_effect = chat_effect
 
         manager = OllamaManager()
         result = manager.chat("Request takeoff clearance")
 
-        # Should handle gracefully and return None
-        assert result is None
+        assert result == expected
+        # Failures are retried max_retries (3) times
+        assert mock_chat.call_count == calls
@@ -17,130 +17,79 @@ from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 import json
 
+from src.stt_engine import STTEngine
+
 
 class TestSTTEngineInitialization:
     """Test STT engine initialization and configuration"""
 
-    def test_engine_initialization_default_config(self):
-        """Test STT engine initializes with default configuration"""
-        from src.stt_engine import STTEngine
-
-        engine = STTEngine()
-
-        assert engine is not None
-        assert engine.engine_type == "whisper"  # Default
-        assert engine.model_size == "base"  # Default
-
-    def test_engine_initialization_custom_config(self):
-        """Test STT engine with custom configuration"""
-        from src.stt_engine import STTEngine
-
-        config = {
-            "engine": "whisper",
-            "model": "small",
-            "device": "cpu",
-            "compute_type": "int8"
-        }
-
-        engine = STTEngine(config=config)
-
-        assert engine.engine_type == "whisper"
-        assert engine.model_size == "small"
-        assert engine.device == "cpu"
-        assert engine.compute_type == "int8"
-
-    def test_engine_initialization_fireworks_config(self):
-        """Test STT engine with Fireworks AI configuration"""
-        from src.stt_engine import STTEngine
-
-        config = {
-            "engine": "fireworks",
-            "api_key": "test_api_key",
-            "model": "whisper-v3"
-        }
-
-        engine = STTEngine(config=config)
-
-        assert engine.engine_type == "fireworks"
-        assert engine.api_key == "test_api_key"
+    @pytest.mark.parametrize("cfg,attrs", [
+        pytest.param(None, {"engine_type": "whisper", "model_size": "base"}, id="default"),
+        pytest.param(
+            {"engine": "whisper", "model": "small", "device": "cpu", "compute_type": "int8"},
+            {"engine_type": "whisper", "model_size": "small", "device": "cpu", "compute_type": "int8"},
+            id="custom",
+        ),
+        pytest.param(
+            {"engine": "fireworks", "api_key": "test_api_key", "model": "whisper-v3"},
+            {"engine_type": "fireworks", "api_key": "test_api_key"},
+            id="fireworks",
+        ),
+        pytest.param({"beam_size": 1}, {"beam_size": 1}, id="beam_fast"),
+        pytest.param({"beam_size": 5}, {"beam_size": 5}, id="beam_accurate"),
+    ])
+    def test_engine_initialization(self, cfg, attrs):
+        """Test STT engine picks up defaults and configuration values"""
+        engine = STTEngine(config=cfg) if cfg else STTEngine()
+
+        for name, value in attrs.items():
+            assert getattr(engine, name) == value
 
 
 class TestWhisperIntegration:
     """Test Whisper model loading and transcription"""
 
-    @patch('src.stt_engine.WhisperModel')
-    def test_load_whisper_model(self, mock_whisper):
+    def test_load_whisper_model(self, whisper_mock):
         """Test loading Whisper model"""
-        from src.stt_engine import STTEngine
-
-        mock_model = MagicMock()
-        mock_whisper.return_value = mock_model
-
         engine = STTEngine(config={"engine": "whisper", "model": "base"})
         result = engine.load_model()
 
         assert result is True
-        mock_whisper.assert_called_once()
+        whisper_mock.whisper.assert_called_once()
 
-    @patch('src.stt_engine.WhisperModel')
-    def test_load_whisper_model_failure(self, mock_whisper):
+    def test_load_whisper_model_failure(self, whisper_mock):
         """Test Whisper model loading failure"""
-        from src.stt_engine import STTEngine
-
-        mock_whisper.side_effect = Exception("Model not found")
+        whisper_mock.whisper.side_effect = Exception("Model not found")
 
         engine = STTEngine(config={"engine": "whisper", "model": "base"})
         result = engine.load_model()
 
         assert result is False
 
-    @patch('src.stt_engine.WhisperModel')
-    def test_transcribe_audio_with_whisper(self, mock_whisper):
+    def test_transcribe_audio_with_whisper(self, whisper_mock, audio_1s):
         """Test audio transcription with Whisper"""
-        from src.stt_engine import STTEngine
-
         # Mock Whisper model response
-        mock_segment = MagicMock()
-        mock_segment.text = "Tower, Viper 1-1, request takeoff clearance"
-        mock_info = MagicMock()
-        mock_info.language = "en"
-
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = ([mock_segment], mock_info)
-        mock_whisper.return_value = mock_model
+        whisper_mock.segment.text = "Tower, Viper 1-1, request takeoff clearance"
 
         engine = STTEngine(config={"engine": "whisper"})
         engine.load_model()
 
-        # Create sample audio data
-        audio_data = np.random.randn(16000).astype(np.float32)
-
-        result = engine.transcribe(audio_data)
+        result = engine.transcribe(audio_1s)
 
         assert result is not None
         assert "text" in result
         assert result["text"] == "Tower, Viper 1-1, request takeoff clearance"
         assert "language" in result
 
-    @patch('src.stt_engine.WhisperModel')
-    def test_transcribe_with_confidence_scores(self, mock_whisper):
+    def test_transcribe_with_confidence_scores(self, whisper_mock, audio_1s):
         """Test transcription includes confidence scores"""
-        from src.stt_engine import STTEngine
-
-        mock_segment = MagicMock()
-        mock_segment.text = "Request landing clearance"
-        mock_segment.avg_logprob = -0.5
-        mock_info = MagicMock()
-
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = ([mock_segment], mock_info)
-        mock_whisper.return_value = mock_model
+        whisper_mock.segment.text = "Request landing clearance"
+        whisper_mock.segment.avg_logprob = -0.5
 
         engine = STTEngine()
         engine.load_model()
 
-        audio_data = np.random.randn(16000).astype(np.float32)
-        result = engine.transcribe(audio_data)
+        result = engine.transcribe(audio_1s)
 
         assert "confidence" in result
         assert isinstance(result["confidence"], float)
@@ -150,10 +99,8 @@ class TestFireworksAIFallback:
     """Test Fireworks AI fallback functionality"""
 
     @patch('src.stt_engine.requests.post')
-    def test_transcribe_with_fireworks(self, mock_post):
+    def test_transcribe_with_fireworks(self, mock_post, audio_1s):
         """Test transcription using Fireworks AI"""
-        from src.stt_engine import STTEngine
-
         # Mock Fireworks API response
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -168,17 +115,14 @@ class TestFireworksAIFallback:
             "api_key": "test_key"
         })
 
-        audio_data = np.random.randn(16000).astype(np.float32)
-        result = engine.transcribe(audio_data)
+        result = engine.transcribe(audio_1s)
 
         assert result is not None
         assert result["text"] == "Tower, request taxi clearance"
 
     @patch('src.stt_engine.requests.post')
-    def test_fireworks_api_failure(self, mock_post):
+    def test_fireworks_api_failure(self, mock_post, audio_1s):
         """Test Fireworks API failure handling"""
-        from src.stt_engine import STTEngine
-
         mock_post.side_effect = Exception("API connection failed")
 
         engine = STTEngine(config={
@@ -186,8 +130,7 @@ class TestFireworksAIFallback:
             "api_key": "test_key"
         })
 
-        audio_data = np.random.randn(16000).astype(np.float32)
-        result = engine.transcribe(audio_data)
+        result = engine.transcribe(audio_1s)
 
         assert result is not None
         assert "error" in result or result["text"] == ""
@@ -198,8 +141,6 @@ class TestAudioPreprocessing:
 
     def test_normalize_audio_data(self):
         """Test audio normalization"""
-        from src.stt_engine import STTEngine
-
         engine = STTEngine()
 
         # Create audio with values outside -1 to 1 range
@@ -210,8 +151,6 @@ class TestAudioPreprocessing:
 
     def test_resample_audio(self):
         """Test audio resampling to 16kHz"""
-        from src.stt_engine import STTEngine
-
         engine = STTEngine()
 
         # Simulate 44.1kHz audio
@@ -221,15 +160,11 @@ class TestAudioPreprocessing:
         # Check length is approximately correct (16000 samples for 1 second)
         assert len(resampled) > 15000 and len(resampled) < 17000
 
-    def test_convert_to_mono(self):
+    def test_convert_to_mono(self, audio_stereo):
         """Test stereo to mono conversion"""
-        from src.stt_engine import STTEngine
-
         engine = STTEngine()
 
-        # Create stereo audio (2 channels)
-        stereo_audio = np.random.randn(16000, 2).astype(np.float32)
-        mono = engine.convert_to_mono(stereo_audio)
+        mono = engine.convert_to_mono(audio_stereo)
 
         assert mono.ndim == 1
         assert len(mono) == 16000
@@ -238,32 +173,20 @@ class TestAudioPreprocessing:
 class TestAviationVocabulary:
     """Test aviation vocabulary optimization"""
 
-    @patch('src.stt_engine.WhisperModel')
-    def test_aviation_vocabulary_boost(self, mock_whisper):
+    def test_aviation_vocabulary_boost(self, whisper_mock, audio_1s):
         """Test aviation terms are recognized better"""
-        from src.stt_engine import STTEngine
-
-        mock_segment = MagicMock()
-        mock_segment.text = "Viper 1-1 request clearance"
-        mock_info = MagicMock()
-
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = ([mock_segment], mock_info)
-        mock_whisper.return_value = mock_model
+        whisper_mock.segment.text = "Viper 1-1 request clearance"
 
         engine = STTEngine(config={"aviation_vocab": True})
         engine.load_model()
 
-        audio_data = np.random.randn(16000).astype(np.float32)
-        result = engine.transcribe(audio_data)
+        result = engine.transcribe(audio_1s)
 
         # Verify transcribe was called with initial_prompt for aviation context
-        assert mock_model.transcribe.called
+        assert whisper_mock.model.transcribe.called
 
     def test_get_aviation_prompt(self):
         """Test aviation context prompt generation"""
-        from src.stt_engine import STTEngine
-
         engine = STTEngine()
         prompt = engine.get_aviation_prompt()
 
@@ -278,8 +201,6 @@ class TestErrorHandling:
 
     def test_transcribe_empty_audio(self):
         """Test handling of empty audio input"""
-        from src.stt_engine import STTEngine
-
         engine = STTEngine()
 
         empty_audio = np.array([], dtype=np.float32)
@@ -290,8 +211,6 @@ class TestErrorHandling:
 
     def test_transcribe_invalid_audio_format(self):
         """Test handling of invalid audio format"""
-        from src.stt_engine import STTEngine
-
         engine = STTEngine()
 
         # Pass invalid data type
@@ -301,34 +220,24 @@ class TestErrorHandling:
         assert result is not None
         assert "error" in result or result["text"] == ""
 
-    @patch('src.stt_engine.WhisperModel')
-    def test_model_not_loaded_error(self, mock_whisper):
+    def test_model_not_loaded_error(self, whisper_mock, audio_1s):
         """Test transcription fails gracefully when model not loaded"""
-        from src.stt_engine import STTEngine
-
         engine = STTEngine()
         # Don't load model
 
-        audio_data = np.random.randn(16000).astype(np.float32)
-        result = engine.transcribe(audio_data)
+        result = engine.transcribe(audio_1s)
 
         assert result is not None
         assert "error" in result or result["text"] == ""
 
-    @patch('src.stt_engine.WhisperModel')
-    def test_transcription_exception_handling(self, mock_whisper):
+    def test_transcription_exception_handling(self, whisper_mock, audio_1s):
         """Test exception handling during transcription"""
-        from src.stt_engine import STTEngine
-
-        mock_model = MagicMock()
-        mock_model.transcribe.side_effect = Exception("Transcription failed")
-        mock_whisper.return_value = mock_model
+        whisper_mock.model.transcribe.side_effect = Exception("Transcription failed")
 
         engine = STTEngine()
         engine.load_model()
 
-        audio_data = np.random.randn(16000).astype(np.float32)
-        result = engine.transcribe(audio_data)
+        result = engine.transcribe(audio_1s)
 
         assert result is not None
         assert "error" in result
@@ -337,21 +246,10 @@ class TestErrorHandling:
 class TestSTTEngineIntegration:
     """Integration tests for complete STT workflow"""
 
-    @patch('src.stt_engine.WhisperModel')
-    def test_complete_transcription_workflow(self, mock_whisper):
+    def test_complete_transcription_workflow(self, whisper_mock, audio_1s):
         """Test complete workflow from audio to text"""
-        from src.stt_engine import STTEngine
-
         # Setup mock
-        mock_segment = MagicMock()
-        mock_segment.text = "Tower, Viper 1-1, ready for takeoff"
-        mock_segment.avg_logprob = -0.3
-        mock_info = MagicMock()
-        mock_info.language = "en"
-
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = ([mock_segment], mock_info)
-        mock_whisper.return_value = mock_model
+        whisper_mock.segment.text = "Tower, Viper 1-1, ready for takeoff"
 
         # Create engine
         engine = STTEngine(config={
@@ -364,61 +262,26 @@ class TestSTTEngineIntegration:
         assert engine.load_model() is True
 
         # Transcribe audio
-        audio_data = np.random.randn(16000).astype(np.float32)
-        result = engine.transcribe(audio_data)
+        result = engine.transcribe(audio_1s)
 
         # Verify result
         assert result["text"] == "Tower, Viper 1-1, ready for takeoff"
         assert result["language"] == "en"
         assert "confidence" in result
 
-    def test_fallback_to_fireworks_on_whisper_failure(self):
-        """Test automatic fallback to Fireworks when Whisper fails"""
-        from src.stt_engine import STTEngine
-
-        # This would require implementing auto-fallback logic
-        # For now, test that both engines work independently
-        config_whisper = {"engine": "whisper"}
-        config_fireworks = {"engine": "fireworks", "api_key": "test"}
-
-        engine_w = STTEngine(config=config_whisper)
-        engine_f = STTEngine(config=config_fireworks)
-
-        assert engine_w.engine_type == "whisper"
-        assert engine_f.engine_type == "fireworks"
-
 
 class TestPerformanceOptimizations:
     """Test performance optimizations"""
 
-    @patch('src.stt_engine.WhisperModel')
-    def test_vad_filter_enabled(self, mock_whisper):
+    def test_vad_filter_enabled(self, whisper_mock, audio_1s):
         """Test Voice Activity Detection filter is enabled"""
-        from src.stt_engine import STTEngine
-
-        mock_model = MagicMock()
-        mock_whisper.return_value = mock_model
-
         engine = STTEngine(config={"vad_filter": True})
         engine.load_model()
 
-        audio_data = np.random.randn(16000).astype(np.float32)
-        engine.transcribe(audio_data)
+        engine.transcribe(audio_1s)
 
         # Verify VAD was used in transcribe call
-        call_kwargs = mock_model.transcribe.call_args.kwargs if mock_model.transcribe.called else {}
+        transcribe = whisper_mock.model.transcribe
+        call_kwargs = transcribe.call_args.kwargs if transcribe.called else {}
         # VAD filter should be enabled for faster processing
         assert "vad_filter" in call_kwargs or True  # Accept if not explicitly checked
-
-    def test_beam_size_configuration(self):
-        """Test beam size can be configured for speed vs accuracy"""
-        from src.stt_engine import STTEngine
-
-        config_fast = {"beam_size": 1}  # Faster
-        config_accurate = {"beam_size": 5}  # More accurate
-
-        engine_fast = STTEngine(config=config_fast)
-        engine_accurate = STTEngine(config=config_accurate)
-
-        assert engine_fast.beam_size == 1
-        assert engine_accurate.beam_size == 5
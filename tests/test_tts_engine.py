@@ -87,6 +87,22 @@ class TestPiperIntegration:
         assert isinstance(audio_data, np.ndarray)
         assert len(audio_data) > 0
 
+    @patch('src.tts_engine.subprocess.run')
+    def test_piper_pcm16_output_decoded(self, mock_run):
+        """Test Piper's raw int16 output is decoded to float32"""
+        from src.tts_engine import TTSEngine
+
+        pcm = np.array([0, 16384, -16384, 32767, -32768], dtype=np.int16)
+        mock_run.return_value = MagicMock(returncode=0, stdout=pcm.tobytes())
+
+        engine = TTSEngine(config={"voice": "en_US-ryan-high"})
+        audio_data = engine._synthesize_with_piper("Roger")
+
+        assert mock_run.call_args.args[0] == ["piper", "--model", "en_US-ryan-high", "--output-raw"]
+        assert mock_run.call_args.kwargs['input'] == b"Roger"
+        assert audio_data.dtype == np.float32
+        np.testing.assert_allclose(audio_data, pcm / 32768.0)
+
     @patch('src.tts_engine.subprocess.run')
     def test_synthesize_empty_text(self, mock_run):
         """Test synthesis with empty text"""
@@ -98,6 +114,19 @@ class TestPiperIntegration:
         assert audio_data is not None
         assert len(audio_data) == 0 or len(audio_data) < 100
 
+    @pytest.mark.parametrize("text", ["", "   \n", None, 12345], ids=["empty", "whitespace", "none", "int"])
+    @patch('src.tts_engine.subprocess.run')
+    def test_synthesize_skips_piper_without_text(self, mock_run, text):
+        """Test empty and non-string input never spawns Piper"""
+        from src.tts_engine import TTSEngine
+
+        engine = TTSEngine()
+        audio_data = engine.synthesize(text)
+
+        assert audio_data.dtype == np.float32
+        assert len(audio_data) == 0
+        mock_run.assert_not_called()
+
     @patch('src.tts_engine.subprocess.run')
     def test_piper_failure_handling(self, mock_run):
         """Test handling of Piper TTS failure"""
@@ -112,6 +141,158 @@ class TestPiperIntegration:
         assert audio_data is not None
 
 
+class _FakePipe:
+    """Readable pipe whose readline() blocks until a line is fed or it closes"""
+
+    def __init__(self):
+        import queue
+
+        self.lines = queue.Queue()
+
+    def readline(self):
+        return self.lines.get()
+
+    def close(self):
+        self.lines.put(b"")
+
+
+class _FakePiperServer:
+    """Stand-in for a piper --json-input process that writes one WAV per line"""
+
+    def __init__(self, samples, reply=True):
+        self.samples = samples
+        self.reply = reply
+        self.pid = 4242
+        self.returncode = None
+        self.requests = []
+        self.stdin = MagicMock(write=self._write)
+        self.stdout = _FakePipe()
+
+    def _write(self, line):
+        import json
+        import wave
+
+        request = json.loads(line)
+        self.requests.append(request["text"])
+        with wave.open(request["output_file"], "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(22050)
+            wav.writeframes(self.samples.tobytes())
+        if self.reply:
+            self.stdout.lines.put(request["output_file"].encode() + b"\n")
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        if self.returncode is None:
+            self.returncode = 0
+        self.stdout.close()
+        return self.returncode
+
+    def kill(self):
+        self.returncode = -9
+        self.stdout.close()
+
+
+class TestPersistentPiper:
+    """Test the long-running Piper process"""
+
+    @patch('src.tts_engine.subprocess.run')
+    @patch('src.tts_engine.subprocess.Popen')
+    def test_persistent_piper_reused_across_calls(self, mock_popen, mock_run):
+        """Test one Piper process serves every utterance"""
+        from src.tts_engine import TTSEngine
+
+        server = _FakePiperServer(np.array([0, 16384, -16384], dtype=np.int16))
+        mock_popen.return_value = server
+
+        engine = TTSEngine(config={"persistent_piper": True})
+        first = engine._synthesize_with_piper("Tower, Viper 1-1")
+        second = engine._synthesize_with_piper("Viper 1-1, cleared")
+
+        mock_popen.assert_called_once()
+        assert mock_popen.call_args.args[0] == ["piper", "--model", "en_US-amy-medium", "--json-input"]
+        mock_run.assert_not_called()
+        assert server.requests == ["Tower, Viper 1-1", "Viper 1-1, cleared"]
+        np.testing.assert_allclose(first, [0.0, 0.5, -0.5])
+        np.testing.assert_array_equal(first, second)
+
+        work_dir = engine._piper_dir.name
+        engine.shutdown()
+        assert engine._piper is None
+        assert not Path(work_dir).exists()
+
+    @patch('src.tts_engine.subprocess.run')
+    @patch('src.tts_engine.subprocess.Popen')
+    def test_persistent_piper_falls_back_to_one_shot(self, mock_popen, mock_run):
+        """Test a Piper process that dies falls back to a one-shot run"""
+        from src.tts_engine import TTSEngine
+
+        server = _FakePiperServer(np.zeros(3, dtype=np.int16))
+        server.stdin.write = MagicMock(side_effect=BrokenPipeError())
+        mock_popen.return_value = server
+        mock_run.return_value = MagicMock(returncode=0, stdout=np.ones(10, dtype=np.int16).tobytes())
+
+        engine = TTSEngine(config={"persistent_piper": True})
+        audio_data = engine._synthesize_with_piper("Say again")
+
+        assert len(audio_data) == 10
+        mock_run.assert_called_once()
+        assert engine._piper is None
+
+    @patch('src.tts_engine.subprocess.run')
+    @patch('src.tts_engine.subprocess.Popen')
+    def test_persistent_piper_times_out(self, mock_popen, mock_run):
+        """Test a Piper process that never answers is killed and bypassed"""
+        from src.tts_engine import TTSEngine
+
+        server = _FakePiperServer(np.zeros(3, dtype=np.int16), reply=False)
+        mock_popen.return_value = server
+        mock_run.return_value = MagicMock(returncode=0, stdout=np.ones(10, dtype=np.int16).tobytes())
+
+        engine = TTSEngine(config={"persistent_piper": True})
+        with patch.object(TTSEngine, 'PIPER_TIMEOUT', 0.1):
+            audio_data = engine._synthesize_with_piper("Say again")
+
+        assert len(audio_data) == 10
+        mock_run.assert_called_once()
+        assert server.returncode == -9
+        assert engine._piper is None
+
+    @patch('src.tts_engine.subprocess.Popen')
+    def test_persistent_piper_reaped_without_shutdown(self, mock_popen):
+        """Test the Piper process is stopped when the engine is dropped"""
+        import gc
+
+        from src.tts_engine import TTSEngine
+
+        server = _FakePiperServer(np.zeros(3, dtype=np.int16))
+        mock_popen.return_value = server
+
+        engine = TTSEngine(config={"persistent_piper": True})
+        engine._synthesize_with_piper("Tower, Viper 1-1")
+        work_dir = engine._piper_dir.name
+        del engine
+        gc.collect()
+
+        assert server.returncode == 0
+        assert not Path(work_dir).exists()
+
+    @patch('src.tts_engine.subprocess.run')
+    @patch('src.tts_engine.subprocess.Popen')
+    def test_persistent_piper_off_by_default(self, mock_popen, mock_run):
+        """Test Piper is spawned per utterance unless enabled"""
+        from src.tts_engine import TTSEngine
+
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"")
+        TTSEngine()._synthesize_with_piper("Roger")
+
+        mock_popen.assert_not_called()
+        mock_run.assert_called_once()
+
+
 class TestRadioEffects:
     """Test military radio effects processing"""
 
@@ -156,6 +337,129 @@ class TestRadioEffects:
         # The filtered audio should be different (frequencies outside 300-3400Hz reduced)
         assert not np.array_equal(audio, filtered)
 
+    def test_bandpass_filter_zero_phase(self):
+        """Test in-band audio passes without phase shift"""
+        from src.tts_engine import TTSEngine
+
+        engine = TTSEngine()
+
+        sample_rate = 22050
+        t = np.arange(0, 1, 1/sample_rate)
+        tone = np.sin(2 * np.pi * 1000 * t).astype(np.float32)
+        audio = tone + np.sin(2 * np.pi * 100 * t).astype(np.float32)
+
+        filtered = engine._apply_bandpass_filter(audio, sample_rate)
+
+        # Away from the edges the 1 kHz tone survives, aligned with the input
+        middle = slice(2000, -2000)
+        np.testing.assert_allclose(filtered[middle], tone[middle], atol=0.05)
+
+    def test_bandpass_coefficients_cached_per_sample_rate(self):
+        """Test filter coefficients are designed once per sample rate"""
+        from src.tts_engine import TTSEngine, signal
+
+        audio = np.random.randn(1000).astype(np.float32)
+
+        with patch.dict(TTSEngine._FILTER_CACHE, clear=True), \
+                patch.object(signal, 'butter', wraps=signal.butter) as mock_butter:
+            engine = TTSEngine()
+            engine._apply_bandpass_filter(audio, 22050)
+            engine._apply_bandpass_filter(audio, 16000)
+            TTSEngine()._apply_bandpass_filter(audio, 16000)
+
+        # 22050 Hz bandpass and radio rolloff at init, 16000 Hz bandpass once,
+        # all shared across engines
+        assert mock_butter.call_count == 3
+
+    def test_bandpass_filter_short_input(self):
+        """Test filtering input shorter than the default edge padding"""
+        from src.tts_engine import TTSEngine
+
+        engine = TTSEngine()
+        audio = np.ones(10, dtype=np.float32)
+
+        filtered = engine._apply_bandpass_filter(audio, 22050)
+
+        assert len(filtered) == len(audio)
+
+    def test_radio_filter_single_stacked_pass(self):
+        """Test radio band limiting runs bandpass and rolloff as one cascade"""
+        from src.tts_engine import TTSEngine, signal
+
+        engine = TTSEngine()
+        radio_sos = engine._get_radio_sos(22050)
+
+        assert len(radio_sos) == len(engine.bandpass_sos) + 1
+        np.testing.assert_array_equal(radio_sos[:-1], engine.bandpass_sos)
+
+        audio = np.random.default_rng(0).standard_normal(4000).astype(np.float32)
+        with patch.object(signal, 'sosfiltfilt', wraps=signal.sosfiltfilt) as mock_filter:
+            engine._apply_bandpass_filter(audio, 22050, radio=True)
+
+        mock_filter.assert_called_once()
+        assert mock_filter.call_args.args[0] is radio_sos
+
+    def test_radio_effects_match_stage_by_stage(self):
+        """Test the fused compression + static stage matches the separate stages"""
+        from src.tts_engine import TTSEngine
+
+        engine = TTSEngine(config={"seed": 3})
+        reference = TTSEngine(config={"seed": 3})
+        audio = np.sin(2 * np.pi * 440 * np.arange(0, 1, 1/22050)).astype(np.float32)
+
+        processed = engine.apply_radio_effects(audio)
+
+        expected = reference._apply_bandpass_filter(audio, 22050, radio=True)
+        expected = reference._apply_compression(expected)
+        expected = reference._add_static_noise(expected)
+        np.testing.assert_allclose(processed, expected, atol=1e-5)
+
+    def test_compress_noise_kernel_in_place(self):
+        """Test the fused compression + static kernel can overwrite its input"""
+        from src import tts_engine
+
+        audio = np.linspace(-1, 1, 101, dtype=np.float32)
+        noise = np.random.default_rng(0).standard_normal(101).astype(np.float32)
+        expected = tts_engine._compress_kernel(audio, 0.2, 4.0) + 0.02 * noise
+
+        result = tts_engine._compress_noise_kernel(audio, 0.2, 4.0, noise, 0.02, audio)
+
+        assert result is audio
+        np.testing.assert_allclose(audio, expected, atol=1e-6)
+
+    def test_radio_effects_leave_input_untouched(self):
+        """Test in-place stages never write to the caller's array"""
+        from src.tts_engine import TTSEngine
+
+        engine = TTSEngine()
+        audio = np.sin(2 * np.pi * 440 * np.arange(0, 1, 1/22050)).astype(np.float32)
+        original = audio.copy()
+
+        engine.apply_radio_effects(audio)
+        with patch('src.tts_engine.signal', None):
+            engine.apply_radio_effects(audio)
+
+        np.testing.assert_array_equal(audio, original)
+
+    def test_fir_bandpass_filter(self):
+        """Test the optional FIR bandpass keeps the voice band in phase"""
+        from src.tts_engine import TTSEngine
+
+        engine = TTSEngine(config={"bandpass_filter": "fir"})
+
+        sample_rate = 22050
+        t = np.arange(0, 1, 1/sample_rate)
+        tone = np.sin(2 * np.pi * 1000 * t).astype(np.float32)
+        audio = tone + np.sin(2 * np.pi * 100 * t) + np.sin(2 * np.pi * 8000 * t)
+
+        filtered = engine._apply_bandpass_filter(audio.astype(np.float32), sample_rate)
+
+        assert filtered.dtype == np.float32
+        assert len(filtered) == len(audio)
+        middle = slice(2000, -2000)
+        np.testing.assert_allclose(filtered[middle], tone[middle], atol=0.05)
+        assert engine._get_bandpass_taps(sample_rate) is engine._get_bandpass_taps(sample_rate)
+
     def test_compression(self):
         """Test dynamic range compression"""
         from src.tts_engine import TTSEngine
@@ -195,6 +499,73 @@ class TestRadioEffects:
         assert not np.array_equal(audio, noisy)
         assert np.std(noisy) > 0  # Should have some variation
 
+    def test_compression_matches_reference_curve(self):
+        """Test the compression kernel against the threshold/ratio curve"""
+        from src.tts_engine import TTSEngine
+
+        engine = TTSEngine()
+        audio = np.array([-0.9, -0.2, -0.1, 0.0, 0.1, 0.2, 0.6, 1.0], dtype=np.float32)
+
+        compressed = engine._apply_compression(audio, threshold=0.2, ratio=4.0)
+
+        expected = np.array([-0.375, -0.2, -0.1, 0.0, 0.1, 0.2, 0.3, 0.4], dtype=np.float32)
+        assert compressed.dtype == np.float32
+        np.testing.assert_allclose(compressed, expected, atol=1e-6)
+
+    def test_radio_effect_numba_kernels(self):
+        """Test the JIT-compiled radio effect kernels when numba is installed"""
+        pytest.importorskip("numba")
+        from src import tts_engine
+
+        assert tts_engine.NUMBA_AVAILABLE is True
+
+        audio = np.linspace(-1, 1, 2001, dtype=np.float32)
+        expected = np.where(np.abs(audio) > 0.2, np.sign(audio) * (0.2 + (np.abs(audio) - 0.2) / 4.0), audio)
+        np.testing.assert_allclose(tts_engine._compress_kernel(audio, 0.2, 4.0), expected, atol=1e-6)
+
+        audio = np.ones(100, dtype=np.float32)
+        noise = np.arange(100, dtype=np.float32)
+        noisy = tts_engine._noise_kernel(audio, noise, 0.5)
+        assert noisy.dtype == np.float32
+        np.testing.assert_allclose(noisy, 1.0 + 0.5 * noise)
+
+        audio = np.linspace(-1, 1, 100, dtype=np.float32)
+        fused = tts_engine._compress_noise_kernel(audio, 0.2, 4.0, noise, 0.5, np.empty_like(audio))
+        expected = tts_engine._noise_kernel(tts_engine._compress_kernel(audio, 0.2, 4.0), noise, 0.5)
+        np.testing.assert_allclose(fused, expected, atol=1e-6)
+
+    def test_static_noise_from_pool(self):
+        """Test static noise is sliced from the pre-generated pool"""
+        from src.tts_engine import TTSEngine
+
+        engine = TTSEngine(config={"sample_rate": 16000})
+        pool = engine._noise_pool
+
+        assert pool.dtype == np.float32
+        assert len(pool) == 16000 * TTSEngine.NOISE_POOL_SECONDS
+        # One pool per sample rate, shared across engines
+        assert TTSEngine(config={"sample_rate": 16000})._noise_pool is pool
+
+        noise = engine._add_static_noise(np.zeros(1000, dtype=np.float32), noise_level=1.0)
+        # The noise is a contiguous window of the pool
+        start = np.flatnonzero(pool == noise[0])[0]
+        np.testing.assert_array_equal(noise, pool[start:start + 1000])
+
+        # Audio longer than the pool still gets noise throughout
+        long_noise = engine._add_static_noise(np.zeros(len(pool) + 10, dtype=np.float32), noise_level=0.05)
+        assert len(long_noise) == len(pool) + 10
+        assert np.std(long_noise[-1000:]) > 0
+
+    def test_static_noise_seed_is_reproducible(self):
+        """Test engines with the same seed add the same static"""
+        from src.tts_engine import TTSEngine
+
+        audio = np.zeros(1000, dtype=np.float32)
+        noisy = [TTSEngine(config={"seed": 7})._add_static_noise(audio) for _ in range(2)]
+
+        np.testing.assert_array_equal(noisy[0], noisy[1])
+        assert not np.array_equal(noisy[0], TTSEngine(config={"seed": 8})._add_static_noise(audio))
+
     def test_radio_effects_disabled(self):
         """Test that radio effects can be disabled"""
         from src.tts_engine import TTSEngine
@@ -244,6 +615,31 @@ class TestResponseCaching:
         # Same text should produce same key
         assert key == engine._get_cache_key(text)
 
+    @pytest.mark.parametrize("xxhash_available", [True, False], ids=["xxhash", "hashlib"])
+    def test_cache_key_distinguishes_voice_and_effects(self, xxhash_available):
+        """Test fast cache keys change with voice and radio effects"""
+        if xxhash_available:
+            pytest.importorskip("xxhash")
+        from src.tts_engine import TTSEngine
+
+        with patch('src.tts_engine.XXHASH_AVAILABLE', xxhash_available):
+            keys = {
+                TTSEngine(config=config)._get_cache_key("Test message")
+                for config in ({}, {"voice": "en_US-ryan-high"}, {"radio_effects": False})
+            }
+
+        assert len(keys) == 3
+
+    def test_cache_key_sha256(self):
+        """Test the collision-resistant cache key option"""
+        from src.tts_engine import TTSEngine
+
+        engine = TTSEngine(config={"cache_key_hash": "sha256"})
+        key = engine._get_cache_key("Test message")
+
+        expected = hashlib.sha256("en_US-amy-medium|True|Test message".encode('utf-8')).hexdigest()
+        assert key == expected
+
     @patch('src.tts_engine.subprocess.run')
     def test_cache_max_size_limit(self, mock_run):
         """Test cache size limit enforcement"""
@@ -261,6 +657,158 @@ class TestResponseCaching:
         # Cache should not exceed max size
         assert len(engine.response_cache) <= 5
 
+    @patch('src.tts_engine.subprocess.run')
+    def test_cache_evicts_least_recently_used(self, mock_run):
+        """Test cache hits protect an entry from eviction"""
+        from src.tts_engine import TTSEngine
+
+        mock_run.return_value = MagicMock(returncode=0, stdout=np.ones(100, dtype=np.int16).tobytes())
+
+        engine = TTSEngine(config={"cache_max_size": 2})
+        engine.synthesize("Message 0")
+        engine.synthesize("Message 1")
+        engine.synthesize("Message 0")  # Hit, now most recent
+        engine.synthesize("Message 2")  # Evicts Message 1
+
+        assert list(engine.response_cache) == [engine._get_cache_key("Message 0"), engine._get_cache_key("Message 2")]
+        assert mock_run.call_count == 3
+
+    @patch('src.tts_engine.subprocess.run')
+    def test_cache_byte_limit(self, mock_run):
+        """Test the cache evicts entries beyond its byte limit"""
+        from src.tts_engine import TTSEngine
+
+        # 1000 samples are cached as 4000 bytes of float32
+        mock_run.return_value = MagicMock(returncode=0, stdout=np.ones(1000, dtype=np.int16).tobytes())
+
+        engine = TTSEngine(config={"cache_max_size": 50, "cache_max_bytes": 10_000})
+        for i in range(5):
+            engine.synthesize(f"Message {i}")
+
+        assert len(engine.response_cache) == 2
+        assert engine._cache_bytes == sum(a.nbytes for a in engine.response_cache.values())
+
+        engine.clear_cache()
+        assert len(engine.response_cache) == 0
+        assert engine._cache_bytes == 0
+
+    @patch('src.tts_engine.subprocess.run')
+    def test_disk_cache_persists_across_engines(self, mock_run, tmp_path):
+        """Test a new engine reuses audio cached on disk by an earlier one"""
+        from src.tts_engine import TTSEngine
+
+        mock_run.return_value = MagicMock(returncode=0, stdout=np.ones(1000, dtype=np.int16).tobytes())
+        config = {"cache_enabled": True, "cache_dir": str(tmp_path)}
+
+        audio1 = TTSEngine(config=config).synthesize("Tower, cleared for takeoff")
+        engine = TTSEngine(config=config)
+        audio2 = engine.synthesize("Tower, cleared for takeoff")
+
+        assert mock_run.call_count == 1
+        assert len(list(tmp_path.glob("*.npy"))) == 1
+        np.testing.assert_array_equal(audio1, audio2)
+        # Disk hits also feed the memory tier
+        assert len(engine.response_cache) == 1
+
+    @patch('src.tts_engine.subprocess.run')
+    def test_disk_cache_hit_is_memory_mapped(self, mock_run, tmp_path):
+        """Test disk hits are read-only memory maps outside the memory byte limit"""
+        from src.tts_engine import TTSEngine
+
+        mock_run.return_value = MagicMock(returncode=0, stdout=np.ones(1000, dtype=np.int16).tobytes())
+        config = {"cache_dir": str(tmp_path), "cache_max_bytes": 1000}
+
+        TTSEngine(config=config).synthesize("Tower, cleared for takeoff")
+        engine = TTSEngine(config=config)
+        audio = engine.synthesize("Tower, cleared for takeoff")
+
+        assert isinstance(audio, np.memmap)
+        assert not audio.flags.writeable
+        # 4000 bytes of audio, yet kept by a 1000-byte memory cache
+        assert len(engine.response_cache) == 1
+        assert engine._cache_bytes == 0
+
+    @patch('src.tts_engine.subprocess.run')
+    def test_disk_cache_byte_limit(self, mock_run, tmp_path):
+        """Test the disk cache evicts old files beyond its byte limit"""
+        from src.tts_engine import TTSEngine
+
+        # 9000 samples are cached as float32, ~36 kB per file
+        mock_run.return_value = MagicMock(returncode=0, stdout=np.ones(9000, dtype=np.int16).tobytes())
+        engine = TTSEngine(config={"cache_dir": str(tmp_path), "disk_cache_max_bytes": 100_000})
+
+        for i in range(5):
+            engine.synthesize(f"Message {i}")
+
+        files = list(tmp_path.glob("*.npy"))
+        assert 0 < len(files) < 5
+        assert sum(f.stat().st_size for f in files) <= 100_000
+
+    @patch('src.tts_engine.subprocess.run')
+    def test_disk_cache_tracks_bytes_without_rescanning(self, mock_run, tmp_path):
+        """Test the directory is scanned once at startup, not on every save"""
+        from src.tts_engine import TTSEngine
+
+        mock_run.return_value = MagicMock(returncode=0, stdout=np.ones(1000, dtype=np.int16).tobytes())
+        config = {"cache_dir": str(tmp_path)}
+        TTSEngine(config=config).synthesize("Tower, cleared for takeoff")
+
+        engine = TTSEngine(config=config)
+        assert engine._disk_cache_bytes == sum(f.stat().st_size for f in tmp_path.glob("*.npy"))
+
+        with patch.object(Path, 'glob', side_effect=AssertionError("rescanned")):
+            engine.synthesize("Viper 1-1, cleared to land")
+
+        assert engine._disk_cache_bytes == sum(f.stat().st_size for f in tmp_path.glob("*.npy"))
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    @patch('src.tts_engine.os.replace')
+    def test_disk_cache_temp_files_are_unique(self, mock_replace, tmp_path):
+        """Test concurrent writers of one entry do not share a temp file"""
+        from src.tts_engine import TTSEngine
+
+        engine = TTSEngine(config={"cache_dir": str(tmp_path)})
+        engine._save_to_disk("Tower, cleared for takeoff", np.ones(10, dtype=np.float32))
+        engine._save_to_disk("Tower, cleared for takeoff", np.ones(10, dtype=np.float32))
+
+        first, second = (c.args[0] for c in mock_replace.call_args_list)
+        assert first != second
+        assert first.parent == tmp_path
+        assert first.suffix == ".tmp"
+
+    @patch('src.tts_engine.subprocess.run')
+    def test_disk_cache_skips_files_it_cannot_delete(self, mock_run, tmp_path):
+        """Test eviction carries on past a locked (e.g. memory-mapped) file"""
+        from src.tts_engine import TTSEngine
+
+        mock_run.return_value = MagicMock(returncode=0, stdout=np.ones(9000, dtype=np.int16).tobytes())
+        engine = TTSEngine(config={"cache_dir": str(tmp_path), "disk_cache_max_bytes": 100_000})
+        locked = engine._get_disk_cache_path(tmp_path, "Message 0")
+        unlink = Path.unlink
+
+        def locked_unlink(path, missing_ok=False):
+            if path == locked:
+                raise PermissionError("file is mapped")
+            return unlink(path, missing_ok=missing_ok)
+
+        with patch.object(Path, 'unlink', locked_unlink):
+            for i in range(5):
+                assert len(engine.synthesize(f"Message {i}")) == 9000
+
+        files = list(tmp_path.glob("*.npy"))
+        assert locked in files
+        assert len(files) < 5
+        assert sum(f.stat().st_size for f in files) <= 100_000
+
+    def test_disk_cache_off_by_default(self):
+        """Test only the memory cache is used without a cache_dir"""
+        from src.tts_engine import TTSEngine
+
+        engine = TTSEngine()
+
+        assert engine._disk_cache_dir is None
+        assert engine._load_from_disk("Test message") is None
+
     def test_cache_disabled(self):
         """Test that caching can be disabled"""
         from src.tts_engine import TTSEngine
@@ -317,6 +865,53 @@ class TestAudioOutput:
 
         assert result is True
 
+    @patch('src.tts_engine.sf')
+    def test_save_audio_with_soundfile(self, mock_sf):
+        """Test WAV files are written as 16-bit PCM by soundfile when available"""
+        from src.tts_engine import TTSEngine
+
+        engine = TTSEngine()
+        audio_data = np.array([0.0, 0.5, 1.5, -1.5], dtype=np.float32)
+
+        assert engine.save_audio(audio_data, "out.wav") is True
+
+        args, kwargs = mock_sf.write.call_args
+        assert args[0] == "out.wav" and args[2] == engine.sample_rate
+        assert kwargs == {'format': 'WAV', 'subtype': 'PCM_16'}
+        np.testing.assert_array_equal(args[1], [0.0, 0.5, 1.0, -1.0])
+
+    def test_save_audio_soundfile_round_trip(self, tmp_path):
+        """Test soundfile writes a 16-bit WAV whatever the file extension"""
+        sf = pytest.importorskip("soundfile")
+        from src.tts_engine import TTSEngine
+
+        engine = TTSEngine()
+        path = tmp_path / "clip.pcm"
+
+        assert engine.save_audio(np.array([0.0, 0.5, 1.5, -1.5], dtype=np.float32), str(path)) is True
+
+        info = sf.info(str(path))
+        assert (info.format, info.subtype) == ('WAV', 'PCM_16')
+        saved, rate = sf.read(str(path), dtype='float32')
+        assert rate == engine.sample_rate
+        np.testing.assert_allclose(saved, [0.0, 0.5, 1.0, -1.0], atol=1e-4)
+
+    @patch('src.tts_engine.sf', None)
+    def test_save_audio_clips_to_int16(self, tmp_path):
+        """Test the scipy fallback clips out-of-range samples rather than wrapping"""
+        from src.tts_engine import TTSEngine
+        from scipy.io import wavfile
+
+        engine = TTSEngine()
+        path = tmp_path / "clip.wav"
+
+        assert engine.save_audio(np.array([0.0, 0.5, 1.5, -1.5], dtype=np.float32), str(path)) is True
+
+        rate, saved = wavfile.read(path)
+        assert rate == engine.sample_rate
+        assert saved.dtype == np.int16
+        np.testing.assert_array_equal(saved, [0, 16383, 32767, -32768])
+
 
 class TestErrorHandling:
     """Test error handling and graceful degradation"""
@@ -453,6 +1048,18 @@ class TestPerformanceOptimizations:
         # Should be normalized to [-1, 1] range
         assert np.max(np.abs(normalized)) <= 1.0
 
+    def test_normalize_audio_in_place(self):
+        """Test normalization can scale into the input buffer"""
+        from src.tts_engine import TTSEngine
+
+        engine = TTSEngine()
+        audio = np.array([0.1, -0.5, 0.25], dtype=np.float32)
+
+        normalized = engine._normalize_audio(audio, out=audio)
+
+        assert normalized is audio
+        np.testing.assert_allclose(audio, [0.2, -1.0, 0.5])
+
 
 class TestVoiceConfiguration:
     """Test voice model configuration"""
@@ -6,12 +6,57 @@ Following TDD methodology - write tests first, then implement.
 
 import pytest
 import numpy as np
-from unittest.mock import Mock, patch, MagicMock, call
+from unittest.mock import Mock, patch, call
 import sys
+import types
 
-# Mock audio libraries before importing
-sys.modules['sounddevice'] = MagicMock()
-sys.modules['keyboard'] = MagicMock()
+
+class _StubInputStream:
+    """Inert stand-in for sounddevice.InputStream"""
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+    def read(self, frames):
+        return np.zeros((frames, 1), dtype=np.int16), False
+
+
+def _stub_module(name, **attrs):
+    """Build a stub module exposing only the given attributes"""
+    module = types.ModuleType(name)
+    for attr, value in attrs.items():
+        setattr(module, attr, value)
+    return module
+
+
+# Stub audio libraries before importing. Plain modules with just the
+# attributes the handler touches resolve much faster than MagicMock, and
+# @patch('sounddevice.InputStream') etc. still work on them.
+sys.modules['sounddevice'] = _stub_module(
+    'sounddevice',
+    InputStream=_StubInputStream,
+    RawInputStream=_StubInputStream,
+    query_devices=lambda *args, **kwargs: [],
+    play=lambda *args, **kwargs: None,
+    wait=lambda: None,
+)
+sys.modules['keyboard'] = _stub_module(
+    'keyboard',
+    is_pressed=lambda hotkey: False,
+    # Same shape as the real parser: one step, one group per key (names
+    # stand in for scan codes)
+    parse_hotkey=lambda hotkey: (tuple((name,) for name in hotkey.split('+')),),
+)
 
 
 class TestVoiceInputHandler:
@@ -81,7 +126,7 @@ class TestVoiceInputHandler:
 
         # Simulate some audio data
         test_audio = np.zeros(1000, dtype=np.float32)
-        handler._buffer = test_audio
+        handler._push_audio(test_audio)
 
         audio_data = handler.get_audio_data()
 
@@ -94,11 +139,12 @@ class TestVoiceInputHandler:
         from src.voice_input import VoiceInputHandler
 
         handler = VoiceInputHandler()
-        handler._buffer = np.zeros(1000, dtype=np.float32)
+        handler._push_audio(np.zeros(1000, dtype=np.float32))
 
         handler.clear_buffer()
 
-        assert len(handler._buffer) == 0 or handler._buffer is None
+        assert handler._buffer_sample_count == 0
+        assert handler.get_audio_data() is None
 
 
 class TestPTTDetection:
@@ -128,6 +174,100 @@ class TestPTTDetection:
 
         assert is_pressed is False
 
+    @patch('keyboard.is_pressed')
+    @patch('keyboard.parse_hotkey')
+    def test_ptt_key_parsed_once(self, mock_parse, mock_is_pressed):
+        """Test PTT hotkey is parsed at init, not on every poll"""
+        from src.voice_input import VoiceInputHandler
+
+        mock_parse.return_value = (((29, 97), (42, 54)),)
+        mock_is_pressed.return_value = True
+        handler = VoiceInputHandler(config={'ptt_key': 'ctrl+shift'})
+
+        for _ in range(3):
+            assert handler.is_ptt_pressed() is True
+
+        mock_parse.assert_called_once_with('ctrl+shift')
+        # Scan codes are checked directly, never the hotkey string
+        assert {c.args[0] for c in mock_is_pressed.call_args_list} <= {29, 97, 42, 54}
+
+    @patch('keyboard.is_pressed')
+    @patch('keyboard.parse_hotkey')
+    def test_ptt_chord_requires_every_key(self, mock_parse, mock_is_pressed):
+        """Test PTT chord is not pressed while only one of its keys is held"""
+        from src.voice_input import VoiceInputHandler
+
+        mock_parse.return_value = (((29, 97), (42, 54)),)
+        handler = VoiceInputHandler(config={'ptt_key': 'ctrl+shift'})
+
+        # Right ctrl alone
+        mock_is_pressed.side_effect = lambda code: code == 97
+        assert handler.is_ptt_pressed() is False
+
+        # Right ctrl + left shift
+        mock_is_pressed.side_effect = lambda code: code in (97, 42)
+        assert handler.is_ptt_pressed() is True
+
+    @patch('keyboard.unhook', create=True)
+    @patch('keyboard.hook', create=True)
+    @patch('keyboard.is_pressed')
+    @patch('keyboard.parse_hotkey')
+    def test_ptt_hook_tracks_chord_edges(self, mock_parse, mock_is_pressed, mock_hook, mock_unhook):
+        """Test the keyboard hook keeps PTT state without polling is_pressed"""
+        from types import SimpleNamespace
+        from src.voice_input import VoiceInputHandler
+
+        mock_parse.return_value = (((29, 97), (42, 54)),)
+        handler = VoiceInputHandler(config={'ptt_key': 'ctrl+shift'})
+        on_key = mock_hook.call_args.args[0]
+
+        def key(code, event_type):
+            on_key(SimpleNamespace(scan_code=code, event_type=event_type))
+
+        key(97, 'down')
+        key(30, 'down')  # Unrelated key
+        assert handler.is_ptt_pressed() is False
+        assert not handler._ptt_edge.is_set()
+
+        key(42, 'down')
+        assert handler.is_ptt_pressed() is True
+        assert handler.wait_for_ptt(timeout=0) is True
+        assert not handler._ptt_edge.is_set()
+
+        key(42, 'down')  # Key repeat is not an edge
+        assert not handler._ptt_edge.is_set()
+
+        key(97, 'up')
+        assert handler.wait_for_ptt(timeout=0) is False
+        mock_is_pressed.assert_not_called()
+
+        hook = handler._keyboard_hook
+        handler.shutdown()
+        mock_unhook.assert_called_once_with(hook)
+
+    @patch('keyboard.hook', create=True)
+    @patch('keyboard.is_pressed')
+    def test_ptt_hook_failure_falls_back_to_polling(self, mock_is_pressed, mock_hook):
+        """Test PTT is polled when the keyboard hook cannot be installed"""
+        from src.voice_input import VoiceInputHandler
+
+        mock_hook.side_effect = ImportError("You must be root to use this library on linux.")
+        mock_is_pressed.return_value = True
+
+        handler = VoiceInputHandler()
+
+        assert handler._keyboard_hook is None
+        assert handler.is_ptt_pressed() is True
+
+    @patch('keyboard.hook', create=True)
+    def test_continuous_mode_installs_no_hook(self, mock_hook):
+        """Test continuous recording does not listen to the keyboard"""
+        from src.voice_input import VoiceInputHandler
+
+        VoiceInputHandler(config={'continuous_mode': True})
+
+        mock_hook.assert_not_called()
+
     @patch('keyboard.is_pressed')
     @patch('sounddevice.InputStream')
     def test_ptt_triggers_recording(self, mock_stream, mock_is_pressed):
@@ -160,6 +300,18 @@ class TestPTTDetection:
 
         assert handler.is_recording is False
 
+    @patch('keyboard.is_pressed')
+    @patch('sounddevice.InputStream')
+    def test_continuous_mode_ignores_ptt(self, mock_stream, mock_is_pressed):
+        """Test continuous mode records without polling the PTT key"""
+        from src.voice_input import VoiceInputHandler
+
+        handler = VoiceInputHandler(config={'continuous_mode': True})
+        handler.check_ptt_and_record()
+
+        assert handler.is_recording is True
+        mock_is_pressed.assert_not_called()
+
 
 class TestAudioCapture:
     """Test suite for audio capture functionality"""
@@ -181,7 +333,7 @@ class TestAudioCapture:
         handler._audio_callback(indata, frames, time_info, status)
 
         # Buffer should contain data
-        assert handler._buffer is not None
+        assert handler._buffer_sample_count == frames
 
     @patch('sounddevice.InputStream')
     def test_buffer_management(self, mock_stream):
@@ -218,6 +370,150 @@ class TestAudioCapture:
         # Buffer should be limited
         assert len(audio_data) <= max_samples * 1.1  # Allow 10% overhead
 
+    @patch('sounddevice.InputStream')
+    def test_buffer_stores_pcm16(self, mock_stream):
+        """Test float input is buffered as int16 and returned as float32"""
+        from src.voice_input import VoiceInputHandler
+
+        handler = VoiceInputHandler()
+        handler.start_recording()
+
+        indata = np.linspace(-1.0, 1.0, 1024, dtype=np.float32).reshape(-1, 1)
+        handler._audio_callback(indata, 1024, {}, None)
+
+        assert handler._ring.dtype == np.int16
+
+        audio_data = handler.get_audio_data()
+        assert audio_data.dtype == np.float32
+        np.testing.assert_allclose(audio_data, indata[:, 0], atol=1.0 / 32768)
+
+    @patch('sounddevice.InputStream')
+    def test_blocking_capture_mode(self, mock_stream):
+        """Test blocking capture reads the stream from a worker thread"""
+        from src.voice_input import VoiceInputHandler
+        import time
+
+        mock_stream.return_value.read.return_value = (np.full((1024, 1), 0.1, dtype=np.float32), False)
+
+        handler = VoiceInputHandler(config={'capture_mode': 'blocking'})
+        handler.start_recording()
+
+        # No Python callback is registered with PortAudio
+        assert mock_stream.call_args.kwargs['callback'] is None
+
+        deadline = time.monotonic() + 1.0
+        while handler.get_audio_data() is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        reader = handler._reader_thread
+        handler.stop_recording()
+
+        assert handler.get_audio_data() is not None
+        assert not reader.is_alive()
+        assert handler.is_recording is False
+
+    @patch('sounddevice.RawInputStream')
+    def test_raw_capture_mode(self, mock_raw_stream):
+        """Test raw capture wraps the PortAudio buffer into the ring"""
+        from src import voice_input
+        from src.voice_input import VoiceInputHandler
+
+        handler = VoiceInputHandler(config={'capture_mode': 'raw'})
+        assert handler.start_recording() is True
+
+        kwargs = mock_raw_stream.call_args.kwargs
+        assert kwargs['dtype'] == 'int16'
+        assert kwargs['callback'] == handler._raw_callback
+
+        # RawInputStream hands the callback a plain buffer, not an ndarray
+        block = bytearray(np.arange(1024, dtype=np.int16).tobytes())
+        handler._raw_callback(block, 1024, None, None)
+
+        buffered = handler.get_audio_data() * voice_input.PCM16_SCALE
+        np.testing.assert_array_equal(buffered, np.arange(1024))
+
+    def test_buffer_keeps_most_recent_blocks(self):
+        """Test buffer evicts the oldest blocks once max_buffer_seconds is reached"""
+        from src import voice_input
+        from src.voice_input import VoiceInputHandler
+
+        handler = VoiceInputHandler(config={
+            'sample_rate': 1000, 'chunk_size': 100, 'max_buffer_seconds': 1
+        })
+        for i in range(15):
+            handler._audio_callback(np.full((100, 1), i, dtype=np.int16), 100, None, None)
+
+        assert handler._buffer_sample_count == 1000
+        buffered = handler.get_audio_data() * voice_input.PCM16_SCALE
+        assert len(buffered) == 1000
+        assert buffered[0] == 5 and buffered[-1] == 14
+
+    def test_buffer_wraps_mid_block(self):
+        """Test the ring buffer unwraps blocks that straddle its end"""
+        from src import voice_input
+        from src.voice_input import VoiceInputHandler
+
+        handler = VoiceInputHandler(config={
+            'sample_rate': 1000, 'chunk_size': 300, 'max_buffer_seconds': 1
+        })
+        for i in range(4):
+            handler._audio_callback(np.arange(i * 300, (i + 1) * 300, dtype=np.int16), 300, None, None)
+
+        buffered = handler.get_audio_data() * voice_input.PCM16_SCALE
+        np.testing.assert_array_equal(buffered, np.arange(200, 1200))
+
+        # A block larger than the buffer keeps only its newest samples
+        handler._audio_callback(np.arange(2500, dtype=np.int16), 2500, None, None)
+        buffered = handler.get_audio_data() * voice_input.PCM16_SCALE
+        np.testing.assert_array_equal(buffered, np.arange(1500, 2500))
+
+    def test_get_audio_data_into_buffer(self):
+        """Test get_audio_data writes into a caller-provided buffer"""
+        from src.voice_input import VoiceInputHandler
+
+        handler = VoiceInputHandler()
+        handler._audio_callback(np.full((1024, 1), 0.5, dtype=np.float32), 1024, None, None)
+
+        out = np.zeros(4096, dtype=np.float32)
+        audio_data = handler.get_audio_data(out=out)
+
+        assert len(audio_data) == 1024
+        assert np.shares_memory(audio_data, out)
+        np.testing.assert_allclose(audio_data, 0.5)
+
+        # Too small: falls back to a fresh allocation
+        small = np.zeros(10, dtype=np.float32)
+        audio_data = handler.get_audio_data(out=small)
+        assert len(audio_data) == 1024
+        assert not np.shares_memory(audio_data, small)
+
+    @patch('sounddevice.InputStream')
+    def test_callback_status_logged_off_audio_thread(self, mock_stream):
+        """Test callback warnings are handed to the listener thread"""
+        from src import voice_input
+        from src.voice_input import VoiceInputHandler
+        import threading
+        import time
+
+        handler = VoiceInputHandler()
+        handler.start_recording()
+
+        seen = []
+        with patch.object(voice_input.logger, 'handle',
+                          side_effect=lambda r: seen.append((r, threading.current_thread()))):
+            handler._audio_callback(np.zeros((1024, 1), dtype=np.int16), 1024, None, 'input overflow')
+
+            deadline = time.monotonic() + 1.0
+            while not seen and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        handler.stop_recording()
+
+        assert len(seen) == 1
+        record, thread = seen[0]
+        assert record.getMessage() == "Audio callback status: input overflow"
+        assert thread is not threading.current_thread()
+
 
 class TestAudioDeviceManagement:
     """Test suite for audio device selection and management"""
@@ -238,6 +534,40 @@ class TestAudioDeviceManagement:
         assert len(devices) == 2
         assert devices[0]['name'] == 'Microphone 1'
 
+    @patch('sounddevice.query_devices')
+    def test_list_input_devices_is_cached(self, mock_query):
+        """Test device enumeration is reused until the cache is invalidated"""
+        from src.voice_input import VoiceInputHandler
+
+        mock_query.return_value = [{'name': 'Microphone 1', 'max_input_channels': 1}]
+
+        handler = VoiceInputHandler()
+        handler.list_input_devices()
+        handler.list_input_devices()
+
+        assert mock_query.call_count == 1
+
+        # Selecting a device invalidates the cached list
+        handler.set_input_device(0)
+        handler.list_input_devices()
+
+        assert mock_query.call_count == 2
+
+    @patch('sounddevice.query_devices')
+    def test_list_input_devices_returns_copy(self, mock_query):
+        """Test callers mutating the returned list do not corrupt the cache"""
+        from src.voice_input import VoiceInputHandler
+
+        mock_query.return_value = [{'name': 'Microphone 1', 'max_input_channels': 1}]
+
+        handler = VoiceInputHandler()
+        devices = handler.list_input_devices()
+        devices[0]['name'] = 'Renamed'
+        devices.append({'name': 'Bogus', 'max_input_channels': 1})
+
+        assert handler.list_input_devices() == [{'name': 'Microphone 1', 'max_input_channels': 1}]
+        assert mock_query.call_count == 1
+
     @patch('sounddevice.query_devices')
     def test_get_default_input_device(self, mock_query):
         """Test getting default input device"""
@@ -318,6 +648,42 @@ class TestVoiceActivityDetection:
         # Should detect with low threshold
         assert has_voice == False  # Still below threshold, use == for numpy boolean
 
+    def test_vad_matches_rms_reference(self):
+        """Test energy kernel agrees with the RMS definition on long buffers"""
+        from src.voice_input import VoiceInputHandler
+
+        handler = VoiceInputHandler(config={'vad_threshold': 0.05})
+        rng = np.random.default_rng(0)
+
+        # 5 seconds of audio either side of the threshold
+        for scale in (0.01, 0.2):
+            audio = (rng.standard_normal(16000 * 5) * scale).astype(np.float32)
+            expected = np.sqrt(np.mean(audio.astype(np.float64) ** 2)) > 0.05
+
+            assert handler.detect_voice_activity(audio) == expected
+
+    def test_sum_squares_numba_kernel(self):
+        """Test the JIT-compiled energy kernel when numba is installed"""
+        pytest.importorskip("numba")
+        from src import voice_input
+
+        assert voice_input.NUMBA_AVAILABLE is True
+
+        audio = np.random.default_rng(1).standard_normal(16000).astype(np.float32)
+        expected = float(np.sum(audio.astype(np.float64) ** 2))
+
+        assert voice_input._sum_squares(audio) == pytest.approx(expected, rel=1e-4)
+
+    def test_vad_multichannel_input(self):
+        """Test VAD accepts (frames, channels) shaped callback buffers"""
+        from src.voice_input import VoiceInputHandler
+
+        handler = VoiceInputHandler()
+
+        audio = np.full((1024, 1), 0.5, dtype=np.float32)
+
+        assert handler.detect_voice_activity(audio)
+
 
 class TestVoiceInputIntegration:
     """Test suite for Voice Input Handler integration"""